@@ -1,17 +1,34 @@
 """Main entry point for Amplifier VS Code server."""
 
+import importlib.util
+
 import uvicorn
-import os
+
+from amplifier_vscode_server.config import SETTINGS
+
+# uvloop ships with uvicorn[standard] on Linux/macOS only; Windows falls back
+# to the stock asyncio loop.
+LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
 
 
 if __name__ == "__main__":
-    host = os.getenv("AMPLIFIER_HOST", "127.0.0.1")
-    port = int(os.getenv("AMPLIFIER_PORT", "8765"))
-
-    uvicorn.run(
-        "amplifier_vscode_server.app:app",
-        host=host,
-        port=port,
-        reload=False,
-        log_level="info"
+    options = dict(
+        host=SETTINGS.host,
+        port=SETTINGS.port,
+        loop=LOOP,
+        http="httptools",
+        log_level="info",
     )
+
+    if SETTINGS.workers > 1:
+        # uvicorn only supervises worker processes for import-string apps,
+        # and it starts them with the "spawn" method, so nothing imported
+        # here would be shared with them. The parent deliberately stays
+        # light and leaves importing the app to each worker.
+        uvicorn.run("amplifier_vscode_server.app:app", workers=SETTINGS.workers, **options)
+    else:
+        # Single process: hand the app object straight to Server, skipping
+        # uvicorn.run's import-string resolution and reload/worker dispatch
+        from amplifier_vscode_server.app import app
+
+        uvicorn.Server(uvicorn.Config(app, **options)).run()
@@ -1,53 +1,76 @@
 """FastAPI application for Amplifier VS Code extension."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
 # Configure logging BEFORE any other imports
+# Handlers only enqueue records; a background listener thread does the
+# formatting and stdout writes so the event loop never blocks on logging.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, _stdout_handler)
+
+# QueueHandler.prepare() merges args into the message using the handler's
+# formatter; keep that to the bare message so the listener applies the
+# real format exactly once.
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stdout,
+    handlers=[_queue_handler],
     force=True  # Override any existing configuration
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import orjson
+from fastapi import FastAPI, Request, Response
 
+from .config import SETTINGS
+from .middleware import InfraMiddleware
+from .responses import ORJSONResponse
 from .routes import router
 
+# Interactive docs are only useful during development
+_docs_enabled = SETTINGS.env != "prod"
+
 app = FastAPI(
     title="Amplifier VS Code Server",
     description="Backend server for Amplifier VS Code extension",
-    version="0.1.0"
+    version="0.1.0",
+    docs_url="/docs" if _docs_enabled else None,
+    redoc_url="/redoc" if _docs_enabled else None,
+    openapi_url="/openapi.json" if _docs_enabled else None,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware for webview communication
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["vscode-webview://*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Single infra middleware (request IDs + CORS for webview communication)
+app.add_middleware(InfraMiddleware, allow_origin_prefix=b"vscode-webview://")
 
 # Include API routes
 app.include_router(router)
 
 
-@app.get("/health")
-async def health():
-    """Health check endpoint."""
-    return {
+# Static probe responses, built once at import. Starlette derives
+# content-length from the fixed body, and a Response carries no per-request
+# state, so the same object is returned on every call.
+_HEALTH_RESPONSE = Response(
+    content=orjson.dumps({
         "status": "healthy",
         "version": "0.1.0"
-    }
-
+    }),
+    media_type="application/json",
+)
 
-@app.get("/info")
-async def info():
-    """Server information endpoint."""
-    return {
+_INFO_RESPONSE = Response(
+    content=orjson.dumps({
         "name": "Amplifier VS Code Server",
         "version": "0.1.0",
         "api_version": "v1",
@@ -56,4 +79,22 @@ async def info():
             "sse": True,
             "profiles": True
         }
-    }
+    }),
+    media_type="application/json",
+)
+
+
+async def health(request: Request) -> Response:
+    """Health check endpoint."""
+    return _HEALTH_RESPONSE
+
+
+async def info(request: Request) -> Response:
+    """Server information endpoint."""
+    return _INFO_RESPONSE
+
+
+# Plain Starlette routes: no parameters to validate, so skip FastAPI's
+# dependency solver and response-model handling
+app.add_route("/health", health, methods=["GET"])
+app.add_route("/info", info, methods=["GET"])
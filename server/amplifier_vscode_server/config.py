@@ -0,0 +1,28 @@
+"""Environment-derived settings for Amplifier VS Code Server."""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Server settings, read from the environment once at import."""
+    host: str
+    port: int
+    workers: int
+    env: str | None
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from AMPLIFIER_* environment variables."""
+        return cls(
+            host=os.getenv("AMPLIFIER_HOST", "127.0.0.1"),
+            port=int(os.getenv("AMPLIFIER_PORT", "8765")),
+            # Sessions live in per-process memory, so extra workers are opt-in
+            # and only useful for stateless endpoints (or behind sticky routing).
+            workers=int(os.getenv("AMPLIFIER_WORKERS", "0")),
+            env=os.getenv("AMPLIFIER_ENV"),
+        )
+
+
+SETTINGS = Settings.from_env()
@@ -1,6 +1,30 @@
 """Core session management for Amplifier VS Code Server."""
 
-from .session_runner import SessionRunner
-from .ux_systems import VSCodeApprovalSystem, VSCodeDisplaySystem
+from typing import TYPE_CHECKING
 
-__all__ = ["SessionRunner", "VSCodeApprovalSystem", "VSCodeDisplaySystem"]
+if TYPE_CHECKING:
+    from .session_runner import SessionRunner
+    from .session_state import SessionState
+    from .ux_systems import VSCodeApprovalSystem, VSCodeDisplaySystem
+
+__all__ = ["SessionRunner", "SessionState", "VSCodeApprovalSystem", "VSCodeDisplaySystem"]
+
+# Public name -> submodule; resolved on first attribute access (PEP 562) so
+# importing the package does not pull in amplifier-core.
+_LAZY_IMPORTS = {
+    "SessionRunner": ".session_runner",
+    "SessionState": ".session_state",
+    "VSCodeApprovalSystem": ".ux_systems",
+    "VSCodeDisplaySystem": ".ux_systems",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
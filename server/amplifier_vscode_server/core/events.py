@@ -0,0 +1,147 @@
+"""Session events queued for SSE delivery."""
+
+import dataclasses
+import functools
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+
+# Fixed-shape payloads for high-volume events. orjson serializes these
+# dataclasses directly, in field order, so no dict is built per event.
+
+@dataclass(slots=True)
+class DisplayText:
+    text: str
+    type: str
+
+
+@dataclass(slots=True)
+class ThinkingDelta:
+    delta: str
+
+
+@dataclass(slots=True)
+class ToolStart:
+    tool_name: str
+    operation: str
+    input: dict[str, Any]
+
+
+@dataclass(slots=True)
+class ToolEnd:
+    tool_name: str
+    operation: str
+    result: dict[str, Any]
+    duration_ms: float | None
+
+
+@dataclass(slots=True)
+class ContentDelta:
+    block_index: int
+    delta: str
+
+
+@dataclass(slots=True)
+class StatusUpdate:
+    status: str
+    message: str | None
+    progress: int | None
+
+
+@dataclass(slots=True)
+class ApprovalRequired:
+    approval_id: str
+    prompt: str
+    options: list[str]
+    timeout: float
+    default: str
+    context: Mapping[str, Any]
+
+
+EventPayload = (
+    dict[str, Any]
+    | DisplayText
+    | ThinkingDelta
+    | ToolStart
+    | ToolEnd
+    | ContentDelta
+    | StatusUpdate
+    | ApprovalRequired
+)
+
+
+class SessionEvent:
+    """An event emitted by a session, as queued for the SSE stream.
+    
+    Keeps the session id apart from the payload; encode() splices both into
+    the wire JSON, so the payload dict is never copied just to add
+    ``session_id``.
+    """
+    
+    __slots__ = ("event", "session_id", "data")
+    
+    def __init__(self, event: str, session_id: str, data: EventPayload):
+        self.event = event
+        self.session_id = session_id
+        self.data = data
+    
+    def encode(self) -> bytes:
+        """Encode as ``{"event": ..., "data": {"session_id": ..., **data}}`` JSON."""
+        head = _event_head(self.event, self.session_id)
+        data = self.data
+        if type(data) is ContentDelta:
+            # Fixed shape: only the delta string needs escaping
+            return head + _CONTENT_DELTA_BODY % (data.block_index, orjson.dumps(data.delta))
+        try:
+            body = orjson.dumps(data, default=_encode_default, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # Values orjson rejects (ints beyond 64 bits, odd keys, unknown
+            # types) still go out, through the stdlib encoder
+            body = json.dumps(
+                data, default=_fallback_default, separators=(",", ":")
+            ).encode()
+        if body == b"{}":
+            return head + b"}}"
+        # body is b'{...}': reuse its members after the session_id
+        return head + b"," + body[1:] + b"}"
+
+
+# Members of a ContentDelta payload, formatted into the frame directly
+_CONTENT_DELTA_BODY = b',"block_index":%d,"delta":%b}}'
+
+
+@functools.lru_cache(maxsize=1024)
+def _event_head(event: str, session_id: str) -> bytes:
+    """Encoded JSON up to the payload members, per event type and session."""
+    return b'{"event":%b,"data":{"session_id":%b' % (
+        orjson.dumps(event),
+        orjson.dumps(session_id),
+    )
+
+
+def _encode_default(obj: Any) -> Any:
+    """Serialize read-only mappings (e.g. MappingProxyType) as objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError
+
+
+def _fallback_default(obj: Any) -> Any:
+    """Serialize payload dataclasses and mappings, anything else as a string."""
+    if dataclasses.is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def sse_message(payload: bytes) -> bytes:
+    """Frame an encoded payload as an SSE ``message`` event.
+    
+    Yielded as bytes, the frame is written as-is by EventSourceResponse.
+    """
+    return b"event: message\r\ndata: " + payload + b"\r\n\r\n"
@@ -1,45 +1,72 @@
 """Session runner wrapping amplifier-core session."""
 
 import asyncio
+import collections
+import functools
+import io
+import itertools
 import logging
-from datetime import datetime
+import os
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable
 
+import orjson
 from amplifier_core import AmplifierSession
 from amplifier_profiles import ProfileLoader, compile_profile_to_mount_plan
 from amplifier_collections import CollectionResolver
 from amplifier_module_resolution import StandardModuleSourceResolver
 
+from .events import EventPayload, SessionEvent
+from .session_state import SessionState
 from .ux_systems import VSCodeApprovalSystem, VSCodeDisplaySystem
-from ..hooks import register_streaming_hooks, register_approval_hook
+from ..hooks import register_vscode_hooks
+from ..models import Credentials, WorkspaceContext
 
 logger = logging.getLogger(__name__)
 
 
-def _get_collection_resolver() -> tuple[CollectionResolver | None, list[Path]]:
-    """Get collection resolver and profile search paths.
+# Collection roots, in priority order
+_COLLECTION_SEARCH_PATHS = (
+    # Local vscode collection (bundled with extension) - FIRST priority
+    Path(__file__).parent.parent / "data" / "collections",
+    # User collections
+    Path.home() / ".amplifier" / "collections",
+    Path.home() / ".local" / "share" / "amplifier" / "collections",
+)
+
+# (collection roots signature, resolver, search_paths) from the last build
+_resolver_cache: tuple[tuple[int, ...], CollectionResolver | None, list[Path]] | None = None
+_resolver_lock = threading.Lock()
+
+
+def _collection_roots_signature() -> tuple[int, ...]:
+    """Return the mtimes of the collection roots (0 for missing roots).
     
-    Returns:
-        Tuple of (collection_resolver, search_paths)
+    Installing or removing a collection changes its root's mtime, which
+    invalidates the cached resolver.
     """
+    signature = []
+    for path in _COLLECTION_SEARCH_PATHS:
+        try:
+            signature.append(path.stat().st_mtime_ns)
+        except OSError:
+            signature.append(0)
+    return tuple(signature)
+
+
+def _build_collection_resolver() -> tuple[CollectionResolver | None, list[Path]]:
+    """Discover collections and build the profile search paths."""
     search_paths = [
         Path.home() / ".amplifier" / "profiles",
         Path(".amplifier") / "profiles",
     ]
     
-    # Add collection paths (including local vscode collection)
-    collection_search_paths = [
-        # Local vscode collection (bundled with extension) - FIRST priority
-        Path(__file__).parent.parent / "data" / "collections",
-        # User collections
-        Path.home() / ".amplifier" / "collections",
-        Path.home() / ".local" / "share" / "amplifier" / "collections",
-    ]
-    
     # Initialize resolver with collection search paths
     try:
-        resolver = CollectionResolver(search_paths=collection_search_paths)
+        resolver = CollectionResolver(search_paths=list(_COLLECTION_SEARCH_PATHS))
         
         # Add profiles directory from each discovered collection
         # list_collections() returns tuples of (collection_name, collection_path)
@@ -54,43 +81,294 @@ def _get_collection_resolver() -> tuple[CollectionResolver | None, list[Path]]:
         return None, search_paths
 
 
+def _get_collection_resolver() -> tuple[CollectionResolver | None, list[Path]]:
+    """Get collection resolver and profile search paths.
+    
+    The result is cached across sessions and rebuilt only when a collection
+    root's mtime changes.
+    
+    Returns:
+        Tuple of (collection_resolver, search_paths)
+    """
+    global _resolver_cache
+    
+    signature = _collection_roots_signature()
+    with _resolver_lock:
+        if _resolver_cache is None or _resolver_cache[0] != signature:
+            resolver, search_paths = _build_collection_resolver()
+            _resolver_cache = (signature, resolver, search_paths)
+        _, resolver, search_paths = _resolver_cache
+    
+    return resolver, list(search_paths)
+
+
+# profile_name -> (search paths signature, compiled mount plan)
+_mount_plan_cache: dict[str, tuple[tuple, dict[str, Any]]] = {}
+
+
+def _search_paths_signature(search_paths: list[Path]) -> tuple:
+    """Return (path, entry mtimes) for every profile search path.
+    
+    Covers added, removed and edited profile files, including profiles
+    pulled in via ``extends`` from another search path.
+    """
+    signature = []
+    for path in search_paths:
+        try:
+            with os.scandir(path) as entries:
+                mtimes = tuple(sorted((e.name, e.stat().st_mtime_ns) for e in entries))
+        except OSError:
+            mtimes = ()
+        signature.append((str(path), mtimes))
+    return tuple(signature)
+
+
+def _load_mount_plan(
+    profile_name: str,
+    resolver: CollectionResolver | None,
+    search_paths: list[Path],
+) -> dict[str, Any]:
+    """Load a profile and compile it to a mount plan.
+    
+    Compiled plans are cached per profile until a search path changes.
+    Callers receive an overlay (see _overlay_mount_plan), so per-session
+    injection never mutates the cached plan.
+    
+    Returns:
+        Mount plan dictionary owned by the caller
+    """
+    signature = _search_paths_signature(search_paths)
+    cached = _mount_plan_cache.get(profile_name)
+    
+    if cached is None or cached[0] != signature:
+        loader = ProfileLoader(
+            search_paths=search_paths,
+            collection_resolver=resolver  # Required for resolving collection:path references
+        )
+        profile = loader.load_profile(profile_name)
+        cached = (signature, compile_profile_to_mount_plan(profile))
+        _mount_plan_cache[profile_name] = cached
+    
+    return _overlay_mount_plan(cached[1])
+
+
+def _overlay_module(entry: Any) -> Any:
+    """Shallow-copy a module entry and its config dict."""
+    if not isinstance(entry, dict):
+        return entry
+    overlay = dict(entry)
+    if isinstance(overlay.get("config"), dict):
+        overlay["config"] = dict(overlay["config"])
+    return overlay
+
+
+def _overlay_mount_plan(mount_plan: dict[str, Any]) -> dict[str, Any]:
+    """Copy a mount plan only down to each module's config dict.
+    
+    Credential, workspace and system instruction injection only write
+    into module entries and their top-level config keys, so those are the
+    only levels copied; deeper values stay shared with the cached plan.
+    """
+    overlay = {}
+    for key, value in mount_plan.items():
+        if isinstance(value, list):
+            overlay[key] = [_overlay_module(entry) for entry in value]
+        else:
+            overlay[key] = _overlay_module(value)
+    return overlay
+
+
+def _inject_working_dir(config: dict[str, Any], workspace_root: str) -> None:
+    """Restrict a tool that takes a single working directory."""
+    config["working_dir"] = workspace_root
+
+
+def _inject_filesystem_paths(config: dict[str, Any], workspace_root: str) -> None:
+    """Restrict tool-filesystem writes and reads to the workspace."""
+    # tool-filesystem uses allowed_write_paths (list of allowed dirs)
+    config["allowed_write_paths"] = [workspace_root]
+    # Also set working_dir for read operations
+    config["working_dir"] = workspace_root
+
+
+_LOG_PREFIX = "[SESSION START]"
+_BANNER = "═" * 39
+
+# Workspace validation summary logged by start(), as one record
+_VALIDATION_SUMMARY = (
+    f"{_LOG_PREFIX} {_BANNER}\n"
+    f"{_LOG_PREFIX} 🔍 Workspace Directory Validation:\n"
+    f"{_LOG_PREFIX}   Server CWD: %s\n"
+    f"{_LOG_PREFIX}   VSCode Workspace: %s\n"
+    f"{_LOG_PREFIX}   Tools will operate in: %s\n"
+    f"{_LOG_PREFIX} {_BANNER}"
+)
+
+# Heading that opens every formatted prompt context
+_CONTEXT_HEADER = "# Current Workspace Context\n\n"
+
+# Bound on buffered SSE event batches per session
+EVENT_QUEUE_MAXSIZE = 1024
+
+# Per-token text deltas: batched, and dropped when the queue is full. Only
+# events whose loss costs a few tokens of display belong here
+_DROPPABLE_EVENTS = frozenset({"content_block:delta"})
+
+# Streaming events are queued in batches of up to EVENT_BATCH_SIZE, or
+# after EVENT_BATCH_DELAY seconds, whichever comes first
+EVENT_BATCH_SIZE = 32
+EVENT_BATCH_DELAY = 0.005
+
+# A blocked backlog drain re-checks for a detached client this often, and
+# _emit_event waits at most EVENT_DRAIN_TIMEOUT seconds for the backlog
+BACKLOG_RECHECK_INTERVAL = 0.5
+EVENT_DRAIN_TIMEOUT = 30.0
+
+# Workspace restriction injector per tool module
+_TOOL_INJECTORS: dict[str, Callable[[dict[str, Any], str], None]] = {
+    "tool-bash": _inject_working_dir,
+    "tool-filesystem": _inject_filesystem_paths,
+    "tool-search": _inject_working_dir,
+}
+
+
+def _system_context_key(workspace_context: WorkspaceContext) -> tuple:
+    """Reduce workspace context to the fields the system instruction uses."""
+    git = workspace_context.git_state
+    git_key = (
+        (git.branch, tuple(itertools.islice(git.modified_files, 5)))
+        if git else None
+    )
+    selection = workspace_context.selection
+    return (
+        workspace_context.workspace_root,
+        git_key,
+        len(workspace_context.diagnostics),
+        selection.path if selection else None,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _system_context_str(key: tuple) -> str:
+    """Build the system instruction context block for a _system_context_key().
+    
+    Returns:
+        Context block
+    """
+    root, git_key, diag_count, selected_path = key
+    
+    # Workspace root (always present)
+    context_parts = [f"Workspace: {root}"]
+    
+    # Git state
+    if git_key is not None:
+        branch, modified_files = git_key
+        context_parts.append(f"Git Branch: {branch}")
+        if modified_files:
+            context_parts.append(f"Modified Files: {', '.join(modified_files)}")
+    
+    # Diagnostics summary
+    if diag_count:
+        context_parts.append(f"Active Problems: {diag_count}")
+    
+    # Selection
+    if selected_path is not None:
+        context_parts.append(f"Selected: {selected_path}")
+    
+    return "\n\n## Current Workspace Context\n" + "\n".join(f"- {part}" for part in context_parts)
+
+
 class SessionRunner:
     """Manages an Amplifier session with event streaming to VS Code."""
     
+    __slots__ = (
+        "session_id",
+        "loop",
+        "profile_name",
+        "credentials",
+        "workspace_context",
+        "session",
+        "_status",
+        "status_listener",
+        "created_at",
+        "_created_ns",
+        "last_activity_ns",
+        "message_count",
+        "input_tokens",
+        "output_tokens",
+        "event_queue",
+        "event_consumers",
+        "_pending_events",
+        "_flush_handle",
+        "_backlog",
+        "_dispatch_task",
+        "pending_approval",
+        "approval_event",
+        "approval_decision",
+        "always_allow_tools",
+        "approval_system",
+        "display_system",
+        "_hook_unregisters",
+        "_token_usage_getter",
+        "_last_context_hash",
+        "_last_context_str",
+    )
+    
     def __init__(
         self,
         session_id: str,
         profile_name: str,
-        credentials: dict[str, Any],
-        workspace_context: dict[str, Any],
+        credentials: Credentials | None,
+        workspace_context: WorkspaceContext | None,
     ):
         self.session_id = session_id
+        # Loop the session runs on, captured once (runners are created
+        # from request handlers) for scheduling timers and tasks
+        self.loop = asyncio.get_running_loop()
         self.profile_name = profile_name
         self.credentials = credentials
         self.workspace_context = workspace_context
         
         # Log workspace context for validation
         logger.info(f"[SESSION INIT] 🏗️  Creating SessionRunner {session_id}")
-        logger.info(f"[SESSION INIT]   📁 Workspace root from VSCode: {workspace_context.get('workspace_root', '(none)')}")
-        logger.info(f"[SESSION INIT]   📋 Context keys: {list(workspace_context.keys())}")
+        logger.info(f"[SESSION INIT]   📁 Workspace root from VSCode: {self.workspace_root or '(none)'}")
+        logger.info(f"[SESSION INIT]   📋 Context keys: {sorted(workspace_context.model_fields_set) if workspace_context else []}")
         
         # Session state
         self.session: AmplifierSession | None = None
-        self.status: Literal["idle", "processing", "awaiting_approval", "error", "stopped"] = "idle"
+        self._status = SessionState.IDLE
+        # Called as listener(runner, old_status) after each status change
+        self.status_listener: Callable[["SessionRunner", SessionState], None] | None = None
         self.created_at = datetime.now()
-        self.last_activity = datetime.now()
+        # Activity is tracked on the monotonic clock; last_activity converts
+        # to a datetime only when read
+        self._created_ns = time.monotonic_ns()
+        self.last_activity_ns = self._created_ns
         
         # Usage tracking
         self.message_count = 0
         self.input_tokens = 0
         self.output_tokens = 0
         
-        # Event queue for SSE streaming
-        self.event_queue: asyncio.Queue = asyncio.Queue()
+        # Event queue for SSE streaming, holding lists of events (bounded so a
+        # slow or absent client cannot grow it without limit)
+        self.event_queue: asyncio.Queue[list[SessionEvent]] = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+        self.event_consumers = 0  # Attached SSE streams
+        
+        # Streaming events waiting to be queued as one batch
+        self._pending_events: list[SessionEvent] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        
+        # Batches waiting on a full queue, fed to it by a background task so
+        # producers never block on a slow client
+        self._backlog: collections.deque[list[SessionEvent]] = collections.deque()
+        self._dispatch_task: asyncio.Task | None = None
         
         # Approval handling
         self.pending_approval: dict[str, Any] | None = None
-        self.approval_future: asyncio.Future | None = None
+        # Decision slot plus the event the current approval request waits on
+        self.approval_event: asyncio.Event | None = None
+        self.approval_decision: str | None = None
         self.always_allow_tools: bool = False  # Session-scoped flag for "Always Allow"
         
         # UX systems
@@ -99,6 +377,35 @@ class SessionRunner:
         
         # Hook unregister functions (populated during start)
         self._hook_unregisters: list[callable] = []
+        
+        # Token usage getter capability (bound during start)
+        self._token_usage_getter: Callable[[], dict[str, int]] | None = None
+        
+        # Last formatted context_update, reused while the context is unchanged
+        self._last_context_hash: int | None = None
+        self._last_context_str: str = ""
+    
+    @property
+    def status(self) -> SessionState:
+        """Current session status."""
+        return self._status
+    
+    @status.setter
+    def status(self, value: SessionState) -> None:
+        old = self._status
+        self._status = value
+        if value is not old and self.status_listener is not None:
+            self.status_listener(self, old)
+    
+    @property
+    def workspace_root(self) -> str | None:
+        """Workspace root sent by VS Code, if any."""
+        return self.workspace_context.workspace_root if self.workspace_context else None
+    
+    @property
+    def last_activity(self) -> datetime:
+        """Wall-clock time of the last activity."""
+        return self.created_at + timedelta(microseconds=(self.last_activity_ns - self._created_ns) // 1000)
     
     async def start(self) -> str:
         """Initialize the session with ProfileLoader and amplifier-core.
@@ -107,191 +414,181 @@ class SessionRunner:
             session_id: The session identifier
         """
         try:
-            logger.info(f"[SESSION START] Starting session {self.session_id} with profile '{self.profile_name}'")
-            logger.debug(f"[SESSION START] Credentials provided: {bool(self.credentials)}")
-            logger.debug(f"[SESSION START] Workspace context provided: {bool(self.workspace_context)}")
+            logger.info("[SESSION START] Starting session %s with profile '%s'", self.session_id, self.profile_name)
+            logger.debug("[SESSION START] Credentials provided: %s", bool(self.credentials))
+            logger.debug("[SESSION START] Workspace context provided: %s", bool(self.workspace_context))
             
-            # Load profile using discovered search paths and collection resolver
-            resolver, search_paths = _get_collection_resolver()
-            logger.debug(f"[SESSION START] Profile search paths: {len(search_paths)} paths")
+            mount_plan = self._load_and_compile_profile()
             
-            loader = ProfileLoader(
-                search_paths=search_paths,
-                collection_resolver=resolver  # Required for resolving collection:path references
+            credentials_count = self._inject_credentials(mount_plan)
+            injected_count = self._inject_workspace_tools(mount_plan)
+            logger.info(
+                "[SESSION START] 🔑 Injected credentials into %d providers, 📁 workspace_dir into %d tools",
+                credentials_count, injected_count,
             )
             
-            logger.info(f"[SESSION START] Loading profile '{self.profile_name}'...")
-            profile = loader.load_profile(self.profile_name)
-            logger.info(f"[SESSION START] Profile loaded successfully")
-            
-            # Compile to mount plan
-            logger.debug(f"[SESSION START] Compiling profile to mount plan...")
-            mount_plan = compile_profile_to_mount_plan(profile)
-            logger.debug(f"[SESSION START] Mount plan compiled. Providers: {len(mount_plan.get('providers', []))}")
-            
-            # Inject credentials into provider config
-            if self.credentials and "providers" in mount_plan:
-                logger.info(f"[SESSION START] 🔑 Injecting credentials into {len(mount_plan['providers'])} providers")
-                logger.info(f"[SESSION START] 🔑 Credentials keys available: {list(self.credentials.keys())}")
-                
-                for provider in mount_plan["providers"]:
-                    logger.info(f"[SESSION START] 🔑 Processing provider module: {provider.get('module')}")
-                    
-                    if "config" not in provider:
-                        provider["config"] = {}
-                    
-                    # Inject API keys
-                    if provider["module"] == "provider-anthropic":
-                        if "anthropic_api_key" in self.credentials:
-                            provider["config"]["api_key"] = self.credentials["anthropic_api_key"]
-                            logger.info(f"[SESSION START] ✅ Injected Anthropic API key into provider config")
-                            logger.debug(f"[SESSION START] 🔑 Provider config keys: {list(provider['config'].keys())}")
-                        else:
-                            logger.warning(f"[SESSION START] ❌ No 'anthropic_api_key' found in credentials dict")
-                            logger.warning(f"[SESSION START] 🔍 Available credential keys: {list(self.credentials.keys())}")
-            else:
-                logger.warning(f"[SESSION START] ⚠️  No credentials ({bool(self.credentials)}) or providers ({bool(mount_plan.get('providers'))}) to inject into")
-            
-            # Inject workspace directory into tool config
-            if self.workspace_context.get("workspace_root") and "tools" in mount_plan:
-                workspace_root = self.workspace_context["workspace_root"]
-                logger.info(f"[SESSION START] 📁 Injecting workspace restrictions into {len(mount_plan['tools'])} tools")
-                logger.info(f"[SESSION START] 📁 Workspace root to inject: {workspace_root}")
-                logger.info(f"[SESSION START] 📁 This will restrict tool operations to: {workspace_root}")
-                
-                injected_count = 0
-                for tool in mount_plan["tools"]:
-                    tool_module = tool.get('module', 'unknown')
-                    logger.info(f"[SESSION START]   📦 Processing tool: {tool_module}")
-                    
-                    if "config" not in tool:
-                        tool["config"] = {}
-                    
-                    # Inject appropriate workspace restriction parameters per tool
-                    if tool_module == "tool-bash":
-                        # tool-bash uses working_dir (single directory)
-                        tool["config"]["working_dir"] = workspace_root
-                        injected_count += 1
-                        logger.info(f"[SESSION START]   ✅ Injected working_dir: {workspace_root}")
-                    elif tool_module == "tool-filesystem":
-                        # tool-filesystem uses allowed_write_paths (list of allowed dirs)
-                        tool["config"]["allowed_write_paths"] = [workspace_root]
-                        # Also set working_dir for read operations
-                        tool["config"]["working_dir"] = workspace_root
-                        injected_count += 1
-                        logger.info(f"[SESSION START]   ✅ Injected allowed_write_paths: [{workspace_root}]")
-                        logger.info(f"[SESSION START]   ✅ Injected working_dir: {workspace_root}")
-                    elif tool_module == "tool-search":
-                        # tool-search uses working_dir (single directory)
-                        tool["config"]["working_dir"] = workspace_root
-                        injected_count += 1
-                        logger.info(f"[SESSION START]   ✅ Injected working_dir: {workspace_root}")
-                    else:
-                        logger.debug(f"[SESSION START]   ⏭️  Skipped (not a filesystem tool)")
-                    
-                    if tool_module in ["tool-bash", "tool-filesystem", "tool-search"]:
-                        logger.info(f"[SESSION START]   ✅ Tool config now has: {list(tool['config'].keys())}")
-                
-                logger.info(f"[SESSION START] 📁 ✨ Successfully configured {injected_count} tools")
-            else:
-                logger.warning(f"[SESSION START] ⚠️  Cannot inject workspace_dir:")
-                logger.warning(f"[SESSION START]     - Has workspace_root: {bool(self.workspace_context.get('workspace_root'))}")
-                logger.warning(f"[SESSION START]     - Has tools: {bool(mount_plan.get('tools'))}")
-                if self.workspace_context.get('workspace_root'):
-                    logger.warning(f"[SESSION START]     - Workspace root value: {self.workspace_context['workspace_root']}")
-                if mount_plan.get('tools'):
-                    logger.warning(f"[SESSION START]     - Tools: {[t.get('module') for t in mount_plan.get('tools', [])]}")
-            
             # Inject workspace context into system instruction
             if self.workspace_context:
                 mount_plan = self._inject_workspace_context(mount_plan)
-                logger.debug(f"[SESSION START] Workspace context injected")
             
             # Create amplifier-core session
-            logger.info(f"[SESSION START] Creating AmplifierSession...")
             self.session = AmplifierSession(
                 config=mount_plan,
                 session_id=self.session_id,
                 approval_system=self.approval_system,
                 display_system=self.display_system,
             )
-            logger.info(f"[SESSION START] AmplifierSession created")
             
             # Store reference to session_runner for hooks to access
             self.session._session_runner = self
-            logger.debug(f"[SESSION START] Session runner reference stored for hook access")
-            logger.info(f"[SESSION START] 🔒 always_allow_tools flag: {self.always_allow_tools}")
             
             # Validation summary
-            logger.info(f"[SESSION START] ═══════════════════════════════════════")
-            logger.info(f"[SESSION START] 🔍 Workspace Directory Validation:")
-            logger.info(f"[SESSION START]   Server CWD: {Path.cwd()}")
-            logger.info(f"[SESSION START]   VSCode Workspace: {self.workspace_context.get('workspace_root', '(none)')}")
-            logger.info(f"[SESSION START]   Tools will operate in: {self.workspace_context.get('workspace_root', 'UNRESTRICTED!')}")
-            logger.info(f"[SESSION START] ═══════════════════════════════════════")
-            
-            # Mount module source resolver BEFORE initialization
-            # This enables git-based module loading from profile sources
-            logger.info(f"[SESSION START] Mounting module source resolver...")
-            resolver = StandardModuleSourceResolver(
-                workspace_dir=Path(self.workspace_context.get("workspace_root")) if self.workspace_context.get("workspace_root") else None,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                workspace_root = self.workspace_root
+                logger.info(
+                    _VALIDATION_SUMMARY,
+                    Path.cwd(),
+                    workspace_root or "(none)",
+                    workspace_root or "UNRESTRICTED!",
+                )
             
-            # Create a mount function for the resolver
-            async def mount_resolver(coordinator):
-                await coordinator.mount("module-source-resolver", resolver, name="standard")
-                return None  # No cleanup needed
-            
-            # Mount the resolver
-            await mount_resolver(self.session.coordinator)
-            logger.info(f"[SESSION START] Module source resolver mounted")
-            
-            # Register streaming bridge hooks BEFORE initialization
-            # This ensures hooks are active when orchestrator starts emitting events
-            logger.info(f"[SESSION START] About to register streaming bridge hooks for session {self.session_id}")
-            self._hook_unregisters = register_streaming_hooks(self.session.coordinator)
-            logger.info(f"[SESSION START] Streaming bridge hooks registered: {len(self._hook_unregisters)} hooks")
-            
-            # Register approval gate hook
-            # This hook intercepts tool:pre events and returns action="ask_user" for destructive tools
-            logger.info(f"[SESSION START] Registering approval gate hook...")
-            approval_unregister = register_approval_hook(self.session.coordinator)
-            self._hook_unregisters.append(approval_unregister)
-            logger.info(f"[SESSION START] Approval gate hook registered")
-            
-            # Verify hooks were registered
-            hooks = self.session.coordinator.hooks
-            all_handlers = hooks.list_handlers()
-            vscode_handlers = {k: v for k, v in all_handlers.items() if any('vscode' in str(n).lower() for n in v)}
-            logger.info(f"[SESSION START] VSCode hooks active: {list(vscode_handlers.keys())}")
+            await self._mount_resolver_and_hooks()
             
             # Initialize the session (now modules can be loaded from git)
-            logger.info(f"[SESSION START] Initializing session (loading modules)...")
             await self.session.initialize()
-            logger.info(f"[SESSION START] Session initialized successfully!")
             
-            # Verify providers were mounted
-            providers = self.session.coordinator.get("providers")
-            logger.info(f"[SESSION START] Providers mounted: {len(providers) if providers else 0}")
-            if not providers:
-                logger.error(f"[SESSION START] ❌ NO PROVIDERS MOUNTED! This will cause errors.")
+            # Token usage getter exposed by the streaming bridge, bound once
+            # instead of looked up on every prompt
+            self._token_usage_getter = self.session.coordinator.get_capability("vscode.token_usage")
+            if not self._token_usage_getter:
+                logger.warning("[TOKEN TRACKING] Token usage capability not available from streaming bridge")
+            
+            provider_count = self._verify_providers()
             
-            self.status = "idle"
-            self.last_activity = datetime.now()
+            self.status = SessionState.IDLE
+            self.last_activity_ns = time.monotonic_ns()
             
-            logger.info(f"[SESSION START] ✅ Session {self.session_id} ready with status={self.status}")
+            logger.info(
+                "[SESSION START] ✅ Session %s ready (%d hooks, %d providers)",
+                self.session_id, len(self._hook_unregisters), provider_count,
+            )
             return self.session_id
             
         except Exception as e:
-            logger.error(f"[SESSION START] ❌ Session initialization failed: {e}")
-            logger.error(f"[SESSION START] Error type: {type(e).__name__}")
-            import traceback
-            logger.error(f"[SESSION START] Traceback:\n{traceback.format_exc()}")
+            logger.exception("[SESSION START] ❌ Session initialization failed (%s): %s", type(e).__name__, e)
             
-            self.status = "error"
+            self.status = SessionState.ERROR
             await self._emit_event("error", {"error": str(e)})
             raise
     
+    def _load_and_compile_profile(self) -> dict[str, Any]:
+        """Load this session's profile as a mount plan it can mutate.
+        
+        Returns:
+            Mount plan dictionary
+        """
+        # Load profile using discovered search paths and collection resolver
+        resolver, search_paths = _get_collection_resolver()
+        logger.debug("[SESSION START] Profile search paths: %d paths", len(search_paths))
+        
+        mount_plan = _load_mount_plan(self.profile_name, resolver, search_paths)
+        logger.debug("[SESSION START] Profile '%s' loaded. Providers: %d", self.profile_name, len(mount_plan.get("providers", [])))
+        return mount_plan
+    
+    def _inject_credentials(self, mount_plan: dict[str, Any]) -> int:
+        """Inject API keys into provider configs.
+        
+        Returns:
+            Number of providers that received credentials
+        """
+        if not (self.credentials and "providers" in mount_plan):
+            logger.warning(
+                "[SESSION START] ⚠️  No credentials (%s) or providers (%s) to inject into",
+                bool(self.credentials), bool(mount_plan.get("providers")),
+            )
+            return 0
+        
+        credentials_count = 0
+        for provider in mount_plan["providers"]:
+            if "config" not in provider:
+                provider["config"] = {}
+            
+            # Inject API keys
+            if provider["module"] == "provider-anthropic":
+                if self.credentials.anthropic_api_key is not None:
+                    provider["config"]["api_key"] = self.credentials.anthropic_api_key
+                    credentials_count += 1
+                else:
+                    logger.warning(
+                        "[SESSION START] ❌ No 'anthropic_api_key' found in credentials (available keys: %s)",
+                        sorted(self.credentials.model_fields_set),
+                    )
+        return credentials_count
+    
+    def _inject_workspace_tools(self, mount_plan: dict[str, Any]) -> int:
+        """Restrict filesystem-capable tools to the workspace root.
+        
+        Returns:
+            Number of tools configured
+        """
+        workspace_root = self.workspace_root
+        if not (workspace_root and "tools" in mount_plan):
+            logger.warning(
+                "[SESSION START] ⚠️  Cannot inject workspace_dir (workspace_root=%r, tools=%s)",
+                workspace_root, [t.get("module") for t in mount_plan.get("tools", [])],
+            )
+            return 0
+        
+        injected_count = 0
+        for tool in mount_plan["tools"]:
+            config = tool.setdefault("config", {})
+            
+            # Inject appropriate workspace restriction parameters per tool
+            injector = _TOOL_INJECTORS.get(tool.get("module"))
+            if injector:
+                injector(config, workspace_root)
+                injected_count += 1
+        return injected_count
+    
+    async def _mount_resolver_and_hooks(self) -> None:
+        """Mount the module source resolver and register VSCode hooks.
+        
+        Both must happen BEFORE session initialization.
+        """
+        coordinator = self.session.coordinator
+        
+        # Mount module source resolver
+        # This enables git-based module loading from profile sources
+        workspace_root = self.workspace_root
+        resolver = StandardModuleSourceResolver(
+            workspace_dir=Path(workspace_root) if workspace_root else None,
+        )
+        await coordinator.mount("module-source-resolver", resolver, name="standard")
+        
+        # Register streaming bridge + approval gate hooks
+        # This ensures hooks are active when orchestrator starts emitting events;
+        # the approval gate intercepts tool:pre and returns action="ask_user"
+        # for destructive tools
+        self._hook_unregisters = register_vscode_hooks(coordinator)
+        
+        # Verify hooks were registered (debug only: list_handlers() walks the registry)
+        if logger.isEnabledFor(logging.DEBUG):
+            all_handlers = coordinator.hooks.list_handlers()
+            vscode_handlers = [k for k, v in all_handlers.items() if any('vscode' in str(n).lower() for n in v)]
+            logger.debug("[SESSION START] VSCode hooks active: %s", vscode_handlers)
+    
+    def _verify_providers(self) -> int:
+        """Check that initialization mounted at least one provider.
+        
+        Returns:
+            Number of mounted providers
+        """
+        providers = self.session.coordinator.get("providers")
+        if not providers:
+            logger.error("[SESSION START] ❌ NO PROVIDERS MOUNTED! This will cause errors.")
+            return 0
+        return len(providers)
+    
     async def prompt(self, prompt: str, context_update: dict[str, Any] | None = None) -> None:
         """Submit a prompt to the session.
         
@@ -302,13 +599,13 @@ class SessionRunner:
         if not self.session:
             raise RuntimeError("Session not initialized")
         
-        if self.status != "idle":
+        if self.status is not SessionState.IDLE:
             raise RuntimeError(f"Session is {self.status}, cannot accept prompt")
         
         try:
-            self.status = "processing"
+            self.status = SessionState.PROCESSING
             self.message_count += 1
-            self.last_activity = datetime.now()
+            self.last_activity_ns = time.monotonic_ns()
             
             # Emit prompt submit event
             await self._emit_event("prompt:submit", {
@@ -319,7 +616,7 @@ class SessionRunner:
             # Format context and enhance prompt
             formatted_prompt = prompt
             if context_update:
-                context_str = self._format_workspace_context(context_update)
+                context_str = self._get_context_str(context_update)
                 if context_str:
                     formatted_prompt = f"{context_str}\n\n# User Message:\n{prompt}"
                     logger.info(f"[CONTEXT] Enhanced prompt with workspace context ({len(context_str)} chars)")
@@ -328,74 +625,77 @@ class SessionRunner:
             # The session will call our UX systems which emit events
             response = await self.session.execute(formatted_prompt)
             
-            # Extract token usage from the streaming bridge hook
-            try:
-                token_usage_getter = self.session.coordinator.get_capability("vscode.token_usage")
-                logger.info(f"[TOKEN TRACKING] Token usage getter capability: {token_usage_getter is not None}")
-                
-                if token_usage_getter:
-                    usage = token_usage_getter()
-                    logger.info(f"[TOKEN TRACKING] Retrieved usage from capability: {usage}")
-                    
-                    if usage:
-                        # The hook tracks cumulative usage, so just use those values
-                        self.input_tokens = usage.get("input_tokens", 0)
-                        self.output_tokens = usage.get("output_tokens", 0)
-                        logger.info(f"[TOKEN TRACKING] Final token counts: input={self.input_tokens}, output={self.output_tokens}")
-                    else:
-                        logger.warning("[TOKEN TRACKING] Usage capability returned None")
-                else:
-                    logger.warning("[TOKEN TRACKING] Token usage capability not available from streaming bridge")
-            except Exception as e:
-                logger.error(f"[TOKEN TRACKING] Failed to extract token usage: {e}", exc_info=True)
+            # Read cumulative token usage tracked by the streaming bridge hook
+            usage = self._token_usage_getter() if self._token_usage_getter else None
+            if usage:
+                self.input_tokens = usage.get("input_tokens", 0)
+                self.output_tokens = usage.get("output_tokens", 0)
             
             # Emit completion event
             token_usage_data = {
                 "input_tokens": self.input_tokens,
                 "output_tokens": self.output_tokens
             }
-            logger.info(f"[TOKEN TRACKING] Emitting prompt:complete with token_usage: {token_usage_data}")
+            logger.debug("[TOKEN TRACKING] Emitting prompt:complete with token_usage: %s", token_usage_data)
             
             await self._emit_event("prompt:complete", {
                 "response": response,
                 "token_usage": token_usage_data
             })
             
-            self.status = "idle"
-            self.last_activity = datetime.now()
+            self.status = SessionState.IDLE
+            self.last_activity_ns = time.monotonic_ns()
             
         except Exception as e:
-            self.status = "error"
+            self.status = SessionState.ERROR
             await self._emit_event("error", {"error": str(e)})
             raise
     
     async def stop(self) -> None:
         """Stop and cleanup the session."""
-        # Unregister streaming hooks first
+        # Unregister hooks first (closing the streaming bridge), reporting
+        # failures once
+        errors = []
         for unregister in self._hook_unregisters:
             try:
                 unregister()
             except Exception as e:
-                logger.warning(f"Error unregistering hook: {e}")
+                errors.append(e)
         self._hook_unregisters.clear()
+        if errors:
+            logger.warning("Error unregistering %d hook(s): %s", len(errors), errors)
         
         if self.session:
             try:
                 await self.session.cleanup()
             except Exception as e:
                 # Log but don't fail
-                await self._emit_event("warning", {"message": f"Cleanup error: {str(e)}"})
+                self._emit_event_nowait("warning", {"message": f"Cleanup error: {str(e)}"})
             finally:
                 self.session = None
         
-        self.status = "stopped"
-        await self._emit_event("session:end", {
+        # Nothing may fire into the queue once the session is gone: cancel
+        # the drain task (a stopped session may have no client left to
+        # drain it) and the flush timer; pending events go out with
+        # session:end
+        if self._dispatch_task is not None:
+            self._dispatch_task.cancel()
+            self._dispatch_task = None
+        self._backlog.clear()
+        batch = self._take_pending_events()
+        
+        self.status = SessionState.STOPPED
+        batch.append(SessionEvent("session:end", self.session_id, {
             "reason": "user_stopped",
             "token_usage": {
                 "input_tokens": self.input_tokens,
                 "output_tokens": self.output_tokens
             }
-        })
+        }))
+        if self.event_queue.full():
+            # The last event of the session makes room rather than wait
+            self.event_queue.get_nowait()
+        self.event_queue.put_nowait(batch)
     
     async def resolve_approval(self, decision: str) -> None:
         """Resolve a pending approval request.
@@ -406,9 +706,6 @@ class SessionRunner:
         if not self.pending_approval:
             raise ValueError("No pending approval")
         
-        if not self.approval_future:
-            raise ValueError("No approval future set")
-        
         logger.info(f"[APPROVAL] 📥 resolve_approval() called with decision: {decision}")
         logger.info(f"[APPROVAL]   Current always_allow_tools: {self.always_allow_tools}")
         
@@ -418,18 +715,49 @@ class SessionRunner:
             logger.info(f"[SESSION] 🔓 Always Allow ENABLED for session {self.session_id}")
             decision = "Allow"  # Treat as Allow for this request
         
-        # Resolve the future with the decision
-        logger.info(f"[APPROVAL] Setting future result to: {decision}")
-        self.approval_future.set_result(decision)
-        logger.info(f"[APPROVAL] ✅ Future resolved")
+        # Hand the decision to the waiting approval request
+        logger.info(f"[APPROVAL] Setting decision to: {decision}")
+        self.set_approval_decision(decision)
+        logger.info(f"[APPROVAL] ✅ Decision delivered")
         
         # Clear pending state
         self.pending_approval = None
-        self.approval_future = None
         
         # Update status
-        if self.status == "awaiting_approval":
-            self.status = "processing"
+        if self.status is SessionState.AWAITING_APPROVAL:
+            self.status = SessionState.PROCESSING
+    
+    def set_approval_decision(self, decision: str) -> None:
+        """Store an approval decision and wake the waiting request.
+        
+        Args:
+            decision: The decision to deliver
+        """
+        self.approval_decision = decision
+        if self.approval_event is not None:
+            self.approval_event.set()
+    
+    def _get_context_str(self, context: dict[str, Any]) -> str:
+        """Return the formatted context, reusing the last one if unchanged.
+        
+        Back-to-back prompts usually carry an identical context_update.
+        
+        Args:
+            context: Workspace context dictionary
+            
+        Returns:
+            Formatted context string
+        """
+        try:
+            context_hash = hash(orjson.dumps(context, default=str, option=orjson.OPT_SORT_KEYS))
+        except orjson.JSONEncodeError:
+            # orjson rejects some valid JSON values (e.g. integers wider
+            # than 64 bits); format those contexts without the cache
+            return self._format_workspace_context(context)
+        if context_hash != self._last_context_hash:
+            self._last_context_str = self._format_workspace_context(context)
+            self._last_context_hash = context_hash
+        return self._last_context_str
     
     def _format_workspace_context(self, context: dict[str, Any]) -> str:
         """Format workspace context into a string for LLM consumption.
@@ -440,90 +768,105 @@ class SessionRunner:
         Returns:
             Formatted context string to prepend to user prompt
         """
-        lines = ["# Current Workspace Context"]
-        lines.append("")
+        # Every line is written with its terminator; the final one is
+        # dropped on return
+        buf = io.StringIO()
+        write = buf.write
+        write(_CONTEXT_HEADER)
         
         # Workspace root
         if workspace_root := context.get("workspace_root"):
-            lines.append(f"**Workspace:** `{workspace_root}`")
-            lines.append("")
+            write(f"**Workspace:** `{workspace_root}`\n")
+            write("\n")
         
         # Open files
         if open_files := context.get("open_files"):
-            lines.append(f"## Open Files ({len(open_files)} files)")
-            for i, file in enumerate(open_files[:5], 1):  # Limit to 5 for brevity
+            write(f"## Open Files ({len(open_files)} files)\n")
+            for i, file in enumerate(itertools.islice(open_files, 5), 1):  # Limit to 5 for brevity
                 path = file.get("path", "unknown")
                 language = file.get("language", "text")
                 content_len = len(file.get("content", ""))
-                lines.append(f"{i}. `{path}` ({language}, {content_len:,} chars)")
+                write(f"{i}. `{path}` ({language}, {content_len:,} chars)\n")
                 
                 # Include cursor position if available
                 if cursor := file.get("cursor_position"):
                     line = cursor.get("line", 0)
                     char = cursor.get("character", 0)
-                    lines.append(f"   - Cursor at line {line}, column {char}")
+                    write(f"   - Cursor at line {line}, column {char}\n")
             
             if len(open_files) > 5:
-                lines.append(f"   - ...and {len(open_files) - 5} more files")
-            lines.append("")
+                write(f"   - ...and {len(open_files) - 5} more files\n")
+            write("\n")
         
         # Git state
         if git := context.get("git_state"):
-            lines.append("## Git Status")
-            lines.append(f"- Branch: `{git.get('branch', 'unknown')}`")
+            write("## Git Status\n")
+            write(f"- Branch: `{git.get('branch', 'unknown')}`\n")
             
             if staged := git.get("staged_files"):
-                lines.append(f"- Staged: {len(staged)} files")
+                write(f"- Staged: {len(staged)} files\n")
                 if staged:
-                    for f in staged[:3]:
-                        lines.append(f"  - `{f}`")
+                    for f in itertools.islice(staged, 3):
+                        write(f"  - `{f}`\n")
                     if len(staged) > 3:
-                        lines.append(f"  - ...and {len(staged) - 3} more")
+                        write(f"  - ...and {len(staged) - 3} more\n")
             
             if modified := git.get("modified_files"):
-                lines.append(f"- Modified: {len(modified)} files")
+                write(f"- Modified: {len(modified)} files\n")
                 if modified:
-                    for f in modified[:3]:
-                        lines.append(f"  - `{f}`")
+                    for f in itertools.islice(modified, 3):
+                        write(f"  - `{f}`\n")
                     if len(modified) > 3:
-                        lines.append(f"  - ...and {len(modified) - 3} more")
+                        write(f"  - ...and {len(modified) - 3} more\n")
             
             if untracked := git.get("untracked_files"):
-                lines.append(f"- Untracked: {len(untracked)} files")
+                write(f"- Untracked: {len(untracked)} files\n")
             
-            lines.append("")
+            write("\n")
         
         # Selection
         if selection := context.get("selection"):
-            lines.append("## Current Selection")
+            write("## Current Selection\n")
             path = selection.get("path", "unknown")
             text = selection.get("text", "")
-            lines.append(f"User has selected text in `{path}`:")
-            lines.append("```")
-            # Limit selection preview to 10 lines
-            text_lines = text.split("\n")
-            if len(text_lines) > 10:
-                lines.extend(text_lines[:10])
-                lines.append(f"... ({len(text_lines) - 10} more lines)")
+            write(f"User has selected text in `{path}`:\n")
+            write("```\n")
+            # Limit selection preview to 10 lines, without splitting the
+            # whole selection
+            line_count = text.count("\n") + 1
+            if line_count > 10:
+                buf.writelines(itertools.islice(io.StringIO(text), 10))
+                write(f"... ({line_count - 10} more lines)\n")
             else:
-                lines.append(text)
-            lines.append("```")
-            lines.append("")
+                write(text)
+                write("\n")
+            write("```\n")
+            write("\n")
         
         # Diagnostics
         if diagnostics := context.get("diagnostics"):
-            error_count = sum(1 for d in diagnostics if d.get("severity") == "error")
-            warning_count = sum(1 for d in diagnostics if d.get("severity") == "warning")
+            # Single pass: count severities and keep the first 5 to show
+            error_count = 0
+            warning_count = 0
+            shown = []
+            for diag in diagnostics:
+                severity = diag.get("severity")
+                if severity == "error":
+                    error_count += 1
+                elif severity == "warning":
+                    warning_count += 1
+                if len(shown) < 5:
+                    shown.append(diag)
             
-            lines.append(f"## Problems ({len(diagnostics)} total)")
+            write(f"## Problems ({len(diagnostics)} total)\n")
             if error_count:
-                lines.append(f"- {error_count} errors")
+                write(f"- {error_count} errors\n")
             if warning_count:
-                lines.append(f"- {warning_count} warnings")
+                write(f"- {warning_count} warnings\n")
             
             # Show first 5 diagnostics
-            lines.append("")
-            for i, diag in enumerate(diagnostics[:5], 1):
+            write("\n")
+            for i, diag in enumerate(shown, 1):
                 severity = diag.get("severity", "info")
                 path = diag.get("path", "unknown")
                 message = diag.get("message", "")
@@ -532,29 +875,129 @@ class SessionRunner:
                 line = start.get("line", 0)
                 
                 icon = "🔴" if severity == "error" else "🟡" if severity == "warning" else "ℹ️"
-                lines.append(f"{i}. {icon} `{path}:{line}` - {message[:80]}")
+                write(f"{i}. {icon} `{path}:{line}` - {message[:80]}\n")
             
             if len(diagnostics) > 5:
-                lines.append(f"   - ...and {len(diagnostics) - 5} more issues")
-            lines.append("")
+                write(f"   - ...and {len(diagnostics) - 5} more issues\n")
+            write("\n")
         
-        return "\n".join(lines)
+        return buf.getvalue()[:-1]
     
     async def _emit_event(self, event_name: str, data: dict[str, Any]) -> None:
-        """Emit an event to the SSE queue.
+        """Emit an event to the SSE queue and wait for any backlog to drain.
+        
+        Used where the caller must not run ahead of the client, e.g. before
+        waiting on an approval decision.
         
         Args:
-            event_name: Event name (e.g., "content_block:delta")
+            event_name: Event name (e.g., "prompt:complete")
             data: Event data
         """
-        event = {
-            "event": event_name,
-            "data": {
-                "session_id": self.session_id,
-                **data
-            }
-        }
-        await self.event_queue.put(event)
+        self._emit_event_nowait(event_name, data)
+        if self._dispatch_task is not None:
+            try:
+                async with asyncio.timeout(EVENT_DRAIN_TIMEOUT):
+                    await asyncio.shield(self._dispatch_task)
+            except TimeoutError:
+                # The batch stays backlogged; don't hold the caller hostage
+                logger.warning("[EVENTS] Backlog for session %s not drained after %ss", self.session_id, EVENT_DRAIN_TIMEOUT)
+            except asyncio.CancelledError:
+                # stop() cancelled the drain; only our own cancellation
+                # propagates
+                if asyncio.current_task().cancelling():
+                    raise
+    
+    def _emit_event_nowait(self, event_name: str, data: EventPayload) -> None:
+        """Emit an event to the SSE queue without blocking.
+        
+        Streaming deltas are buffered and queued as one batch, amortizing
+        queue wakeups over token bursts. Any other event flushes the buffer
+        together with itself, so ordering is preserved.
+        
+        When the queue is full, batches of text deltas are dropped. Other
+        events are handed to a background task that waits for an attached
+        client to catch up, or evict the oldest queued batch if no client is
+        attached.
+        
+        Args:
+            event_name: Event name (e.g., "content_block:delta")
+            data: Event data, as a dict or a payload dataclass
+        """
+        self._pending_events.append(SessionEvent(event_name, self.session_id, data))
+        
+        if event_name in _DROPPABLE_EVENTS:
+            if len(self._pending_events) >= EVENT_BATCH_SIZE:
+                self._flush_events()
+            elif self._flush_handle is None:
+                self._flush_handle = self.loop.call_later(
+                    EVENT_BATCH_DELAY, self._flush_events
+                )
+            return
+        
+        batch = self._take_pending_events()
+        if not self._backlog:
+            try:
+                self.event_queue.put_nowait(batch)
+                return
+            except asyncio.QueueFull:
+                pass
+            
+            if not self.event_consumers:
+                # Nobody is reading: the head of the backlog is the most stale
+                self.event_queue.get_nowait()
+                self.event_queue.put_nowait(batch)
+                return
+        
+        # Backpressure off the hot path, behind anything already waiting
+        self._backlog.append(batch)
+        if self._dispatch_task is None:
+            self._dispatch_task = self.loop.create_task(self._drain_backlog())
+    
+    async def _drain_backlog(self) -> None:
+        """Feed backlogged batches to the queue as the client frees space.
+        
+        If the client detaches while the queue is full, nobody will free
+        space, so the oldest queued batch is evicted instead.
+        """
+        event_queue = self.event_queue
+        try:
+            while self._backlog:
+                if event_queue.full():
+                    if not self.event_consumers:
+                        event_queue.get_nowait()
+                    else:
+                        try:
+                            await asyncio.wait_for(event_queue.put(self._backlog[0]), BACKLOG_RECHECK_INTERVAL)
+                        except TimeoutError:
+                            continue
+                        self._backlog.popleft()
+                        continue
+                event_queue.put_nowait(self._backlog.popleft())
+        finally:
+            self._dispatch_task = None
+    
+    def _take_pending_events(self) -> list[SessionEvent]:
+        """Detach the buffered events and cancel any scheduled flush."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch = self._pending_events
+        self._pending_events = []
+        return batch
+    
+    def _flush_events(self) -> None:
+        """Queue buffered streaming events as one batch."""
+        batch = self._take_pending_events()
+        if not batch:
+            return
+        if self._backlog:
+            # Queue is already full behind the backlog
+            logger.debug("[EVENTS] Queue backlogged, dropping %d streaming events for session %s", len(batch), self.session_id)
+            return
+        try:
+            self.event_queue.put_nowait(batch)
+        except asyncio.QueueFull:
+            logger.debug("[EVENTS] Queue full, dropping %d streaming events for session %s", len(batch), self.session_id)
     
     def _inject_workspace_context(self, mount_plan: dict) -> dict:
         """Inject workspace context into mount plan system instruction.
@@ -568,33 +1011,9 @@ class SessionRunner:
         if not self.workspace_context:
             return mount_plan
         
-        # Build context string
-        context_parts = []
-        
-        # Workspace root
-        if "workspace_root" in self.workspace_context:
-            context_parts.append(f"Workspace: {self.workspace_context['workspace_root']}")
-        
-        # Git state
-        if "git_state" in self.workspace_context and self.workspace_context["git_state"]:
-            git = self.workspace_context["git_state"]
-            context_parts.append(f"Git Branch: {git.get('branch', 'unknown')}")
-            if git.get("modified_files"):
-                context_parts.append(f"Modified Files: {', '.join(git['modified_files'][:5])}")
-        
-        # Diagnostics summary
-        if "diagnostics" in self.workspace_context and self.workspace_context["diagnostics"]:
-            diag_count = len(self.workspace_context["diagnostics"])
-            context_parts.append(f"Active Problems: {diag_count}")
+        context_str = _system_context_str(_system_context_key(self.workspace_context))
         
-        # Selection
-        if "selection" in self.workspace_context and self.workspace_context["selection"]:
-            sel = self.workspace_context["selection"]
-            context_parts.append(f"Selected: {sel.get('path', 'unknown')}")
-        
-        if context_parts:
-            context_str = "\n\n## Current Workspace Context\n" + "\n".join(f"- {part}" for part in context_parts)
-            
+        if context_str:
             # Inject into orchestrator config
             if "orchestrator" not in mount_plan:
                 mount_plan["orchestrator"] = {}
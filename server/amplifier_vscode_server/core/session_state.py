@@ -0,0 +1,18 @@
+"""Session lifecycle states."""
+
+from enum import StrEnum
+
+
+class SessionState(StrEnum):
+    """State of a SessionRunner.
+    
+    Members are the API's status strings, so they serialize, key the
+    status index and match query parameters as plain strings, while
+    internal checks compare members by identity.
+    """
+    
+    IDLE = "idle"
+    PROCESSING = "processing"
+    AWAITING_APPROVAL = "awaiting_approval"
+    ERROR = "error"
+    STOPPED = "stopped"
@@ -2,19 +2,40 @@
 
 import asyncio
 import logging
+import uuid
+from types import MappingProxyType
 from typing import Any, TYPE_CHECKING
 
+from .events import (
+    ApprovalRequired,
+    ContentDelta,
+    DisplayText,
+    StatusUpdate,
+    ThinkingDelta,
+    ToolEnd,
+    ToolStart,
+)
+from .session_state import SessionState
+
 if TYPE_CHECKING:
     from .session_runner import SessionRunner
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only context for approvals that carry none
+_EMPTY_CONTEXT = MappingProxyType({})
+
 
 class VSCodeApprovalSystem:
     """Approval system that communicates approval requests via SSE to VS Code."""
     
+    __slots__ = ("session_runner", "_approval_prefix", "_approval_counter")
+    
     def __init__(self, session_runner: "SessionRunner"):
         self.session_runner = session_runner
+        # Approval IDs are this per-session prefix plus a running count
+        self._approval_prefix = f"appr-{uuid.uuid4().hex[:8]}-"
+        self._approval_counter = 0
     
     async def request_approval(
         self,
@@ -39,11 +60,15 @@ class VSCodeApprovalSystem:
         if options is None:
             options = ["Allow", "Deny"]
         
-        # Create approval ID
-        approval_id = f"appr-{id(self)}"
+        # Create approval ID, unique within this session
+        self._approval_counter += 1
+        approval_id = f"{self._approval_prefix}{self._approval_counter}"
         
-        # Create future for the approval response
-        self.session_runner.approval_future = asyncio.Future()
+        # Fresh event and empty decision slot for this request; a late
+        # resolve of an earlier, timed-out request cannot leak into it
+        approval_event = asyncio.Event()
+        self.session_runner.approval_event = approval_event
+        self.session_runner.approval_decision = None
         
         # Store pending approval
         self.session_runner.pending_approval = {
@@ -54,26 +79,25 @@ class VSCodeApprovalSystem:
         }
         
         # Update session status
-        self.session_runner.status = "awaiting_approval"
+        self.session_runner.status = SessionState.AWAITING_APPROVAL
         
         # Emit approval:required event
         logger.info(f"[APPROVAL SYSTEM] 📡 Emitting approval:required SSE event...")
-        await self.session_runner._emit_event("approval:required", {
-            "approval_id": approval_id,
-            "prompt": prompt,
-            "options": options,
-            "timeout": timeout,
-            "default": default,
-            "context": context or {},
-        })
+        await self.session_runner._emit_event("approval:required", ApprovalRequired(
+            approval_id=approval_id,
+            prompt=prompt,
+            options=options,
+            timeout=timeout,
+            default=default,
+            context=context if context is not None else _EMPTY_CONTEXT,
+        ))
         logger.info(f"[APPROVAL SYSTEM] ✅ approval:required event emitted")
         
         try:
             # Wait for user decision with timeout
-            decision = await asyncio.wait_for(
-                self.session_runner.approval_future,
-                timeout=timeout
-            )
+            async with asyncio.timeout(timeout):
+                await approval_event.wait()
+            decision = self.session_runner.approval_decision
             
             # Emit granted event
             await self.session_runner._emit_event("approval:granted", {
@@ -83,7 +107,7 @@ class VSCodeApprovalSystem:
             
             return decision
             
-        except asyncio.TimeoutError:
+        except TimeoutError:
             # Timeout - use default
             await self.session_runner._emit_event("approval:denied", {
                 "approval_id": approval_id,
@@ -93,7 +117,6 @@ class VSCodeApprovalSystem:
             
             # Clear pending state
             self.session_runner.pending_approval = None
-            self.session_runner.approval_future = None
             
             return default
     
@@ -103,15 +126,17 @@ class VSCodeApprovalSystem:
         Args:
             decision: The user's decision
         """
-        if not self.session_runner.approval_future:
+        if not self.session_runner.pending_approval:
             raise ValueError("No pending approval to resolve")
         
-        self.session_runner.approval_future.set_result(decision)
+        self.session_runner.set_approval_decision(decision)
 
 
 class VSCodeDisplaySystem:
     """Display system that emits events for VS Code UI rendering."""
     
+    __slots__ = ("session_runner",)
+    
     def __init__(self, session_runner: "SessionRunner"):
         self.session_runner = session_runner
     
@@ -122,10 +147,7 @@ class VSCodeDisplaySystem:
             text: Text to display
             type: Display type (info, warning, error)
         """
-        await self.session_runner._emit_event("display:text", {
-            "text": text,
-            "type": type,
-        })
+        self.session_runner._emit_event_nowait("display:text", DisplayText(text, type))
     
     async def display_thinking(self, thinking: str) -> None:
         """Display thinking/reasoning content.
@@ -133,13 +155,13 @@ class VSCodeDisplaySystem:
         Args:
             thinking: Thinking content
         """
-        import logging
-        logger = logging.getLogger(__name__)
+        self.display_thinking_nowait(thinking)
+    
+    def display_thinking_nowait(self, thinking: str) -> None:
+        """Queue thinking content without a coroutine round trip."""
         logger.info(f"[THINKING] VSCodeDisplaySystem.display_thinking() called with {len(thinking)} chars")
         
-        await self.session_runner._emit_event("thinking:delta", {
-            "delta": thinking,
-        })
+        self.session_runner._emit_event_nowait("thinking:delta", ThinkingDelta(thinking))
         
         logger.info(f"[THINKING] thinking:delta event emitted to SSE queue")
     
@@ -156,11 +178,16 @@ class VSCodeDisplaySystem:
             operation: Operation being performed
             input_data: Tool input parameters
         """
-        await self.session_runner._emit_event("tool:pre", {
-            "tool_name": tool_name,
-            "operation": operation,
-            "input": input_data,
-        })
+        self.display_tool_start_nowait(tool_name, operation, input_data)
+    
+    def display_tool_start_nowait(
+        self,
+        tool_name: str,
+        operation: str,
+        input_data: dict[str, Any]
+    ) -> None:
+        """Queue a tool start event without a coroutine round trip."""
+        self.session_runner._emit_event_nowait("tool:pre", ToolStart(tool_name, operation, input_data))
     
     async def display_tool_end(
         self,
@@ -177,12 +204,17 @@ class VSCodeDisplaySystem:
             result: Tool execution result
             duration_ms: Execution duration in milliseconds
         """
-        await self.session_runner._emit_event("tool:post", {
-            "tool_name": tool_name,
-            "operation": operation,
-            "result": result,
-            "duration_ms": duration_ms,
-        })
+        self.display_tool_end_nowait(tool_name, operation, result, duration_ms)
+    
+    def display_tool_end_nowait(
+        self,
+        tool_name: str,
+        operation: str,
+        result: dict[str, Any],
+        duration_ms: float | None = None,
+    ) -> None:
+        """Queue a tool end event without a coroutine round trip."""
+        self.session_runner._emit_event_nowait("tool:post", ToolEnd(tool_name, operation, result, duration_ms))
     
     async def display_content_delta(self, delta: str, block_index: int = 0) -> None:
         """Display streaming content delta.
@@ -191,10 +223,11 @@ class VSCodeDisplaySystem:
             delta: Content delta text
             block_index: Block index for multi-part responses
         """
-        await self.session_runner._emit_event("content_block:delta", {
-            "block_index": block_index,
-            "delta": delta,
-        })
+        self.display_content_delta_nowait(delta, block_index)
+    
+    def display_content_delta_nowait(self, delta: str, block_index: int = 0) -> None:
+        """Queue a streaming content delta without a coroutine round trip."""
+        self.session_runner._emit_event_nowait("content_block:delta", ContentDelta(block_index, delta))
     
     async def display_status(
         self,
@@ -209,8 +242,4 @@ class VSCodeDisplaySystem:
             message: Optional status message
             progress: Optional progress percentage (0-100)
         """
-        await self.session_runner._emit_event("status:update", {
-            "status": status,
-            "message": message,
-            "progress": progress,
-        })
+        self.session_runner._emit_event_nowait("status:update", StatusUpdate(status, message, progress))
@@ -1,6 +1,27 @@
 """Hook modules for bridging amplifier-core events to VSCode UX systems."""
 
+from typing import TYPE_CHECKING
+
 from .streaming_bridge import register_streaming_hooks
 from .approval_hook import register_approval_hook
 
-__all__ = ["register_streaming_hooks", "register_approval_hook"]
+if TYPE_CHECKING:
+    from amplifier_core import ModuleCoordinator
+
+
+def register_vscode_hooks(coordinator: "ModuleCoordinator") -> list[callable]:
+    """
+    Register all VSCode hooks (streaming bridge + approval gate) in one call.
+    
+    Args:
+        coordinator: ModuleCoordinator instance with hooks and display_system
+        
+    Returns:
+        Combined list of unregister functions
+    """
+    unregisters = register_streaming_hooks(coordinator)
+    unregisters.append(register_approval_hook(coordinator))
+    return unregisters
+
+
+__all__ = ["register_streaming_hooks", "register_approval_hook", "register_vscode_hooks"]
@@ -14,7 +14,7 @@ Coordinator detects action="ask_user" and calls approval_system.request_approval
 """
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from amplifier_core import HookResult
 from amplifier_core.events import TOOL_PRE
@@ -24,12 +24,51 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Shared result for every pass-through path (treated as immutable)
+_CONTINUE = HookResult(action="continue")
+
 # Tools that require user approval before execution
-APPROVAL_REQUIRED_TOOLS = {
+APPROVAL_REQUIRED_TOOLS = frozenset({
     "write_file",
     "edit_file",
     "bash",
     "git",  # Reserved for future
+})
+
+
+def _write_file_prompt(input_data: dict[str, Any]) -> str:
+    path = input_data.get("file_path", "file")
+    content_length = len(input_data.get("content", ""))
+    return f"Allow writing {content_length} characters to '{path}'?"
+
+
+def _edit_file_prompt(input_data: dict[str, Any]) -> str:
+    path = input_data.get("file_path", "file")
+    old_len = len(input_data.get("old_string", ""))
+    new_len = len(input_data.get("new_string", ""))
+    return f"Allow editing '{path}' (replacing {old_len} chars with {new_len} chars)?"
+
+
+def _bash_prompt(input_data: dict[str, Any]) -> str:
+    cmd = input_data.get("command", "command")
+    # Truncate long commands for display
+    if len(cmd) > 60:
+        cmd = cmd[:57] + "..."
+    return f"Allow running: {cmd}"
+
+
+def _git_prompt(input_data: dict[str, Any]) -> str:
+    # Reserved for future git tool implementation
+    operation = input_data.get("operation", "operation")
+    return f"Allow git {operation}?"
+
+
+# Prompt builder per gated tool
+_PROMPT_BUILDERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "write_file": _write_file_prompt,
+    "edit_file": _edit_file_prompt,
+    "bash": _bash_prompt,
+    "git": _git_prompt,
 }
 
 
@@ -44,32 +83,11 @@ def _build_approval_prompt(tool_name: str, input_data: dict[str, Any]) -> str:
     Returns:
         Human-readable prompt string
     """
-    if tool_name == "write_file":
-        path = input_data.get("file_path", "file")
-        content_length = len(input_data.get("content", ""))
-        return f"Allow writing {content_length} characters to '{path}'?"
-    
-    elif tool_name == "edit_file":
-        path = input_data.get("file_path", "file")
-        old_len = len(input_data.get("old_string", ""))
-        new_len = len(input_data.get("new_string", ""))
-        return f"Allow editing '{path}' (replacing {old_len} chars with {new_len} chars)?"
-    
-    elif tool_name == "bash":
-        cmd = input_data.get("command", "command")
-        # Truncate long commands for display
-        if len(cmd) > 60:
-            cmd = cmd[:57] + "..."
-        return f"Allow running: {cmd}"
-    
-    elif tool_name == "git":
-        # Reserved for future git tool implementation
-        operation = input_data.get("operation", "operation")
-        return f"Allow git {operation}?"
-    
-    else:
+    builder = _PROMPT_BUILDERS.get(tool_name)
+    if builder is None:
         # Fallback for any other tools added to APPROVAL_REQUIRED_TOOLS
         return f"Allow {tool_name} operation?"
+    return builder(input_data)
 
 
 def _create_approval_gate_hook(coordinator: "ModuleCoordinator"):
@@ -85,6 +103,10 @@ def _create_approval_gate_hook(coordinator: "ModuleCoordinator"):
     Returns:
         Hook handler function with correct signature
     """
+    # The session runner is attached before hooks are registered and is
+    # stable for the session's lifetime
+    session_runner = getattr(coordinator.session, '_session_runner', None)
+    
     async def approval_gate_hook(event: str, data: dict[str, Any]) -> HookResult:
         """
         Hook that gates destructive tools behind user approval.
@@ -101,47 +123,39 @@ def _create_approval_gate_hook(coordinator: "ModuleCoordinator"):
             HookResult with action="ask_user" if approval needed,
             action="continue" if tool is safe to execute
         """
-        logger.info("[APPROVAL GATE] 🔍 Hook triggered!")
-        logger.info(f"[APPROVAL GATE]   Event: {event}")
+        verbose = logger.isEnabledFor(logging.INFO)
         
         tool_name = data.get("tool_name")
         tool_input = data.get("input", {})
         
-        logger.info(f"[APPROVAL GATE]   Tool: {tool_name}")
-        
         if not tool_name:
             logger.warning("[APPROVAL GATE] ❌ tool:pre event missing tool_name")
-            return HookResult(action="continue")
+            return _CONTINUE
         
         # Check if tool requires approval
         if tool_name not in APPROVAL_REQUIRED_TOOLS:
-            logger.info(f"[APPROVAL GATE] ✅ Tool '{tool_name}' does not require approval - CONTINUE")
-            return HookResult(action="continue")
-        
-        logger.info(f"[APPROVAL GATE] 🚦 Tool '{tool_name}' IS in APPROVAL_REQUIRED_TOOLS")
+            if verbose:
+                logger.info(f"[APPROVAL GATE] ✅ {event}: tool '{tool_name}' does not require approval - CONTINUE")
+            return _CONTINUE
         
         # Check if always-allow is enabled for this session
-        session_runner = getattr(coordinator.session, '_session_runner', None)
-        logger.info(f"[APPROVAL GATE]   session_runner: {session_runner is not None}")
-        
         if session_runner:
             always_allow = getattr(session_runner, 'always_allow_tools', False)
-            logger.info(f"[APPROVAL GATE]   always_allow_tools: {always_allow}")
-            
             if always_allow:
-                logger.info(f"[APPROVAL GATE] ✅ Tool '{tool_name}' auto-approved (always allow enabled)")
-                return HookResult(action="continue")
+                if verbose:
+                    logger.info(f"[APPROVAL GATE] ✅ {event}: tool '{tool_name}' auto-approved (always allow enabled)")
+                return _CONTINUE
         else:
             logger.warning(f"[APPROVAL GATE] ⚠️ Could not access session_runner from coordinator.session")
         
         # Tool requires approval - build prompt and request approval
         prompt = _build_approval_prompt(tool_name, tool_input)
         
-        logger.info(f"[APPROVAL GATE] 🚦 Tool '{tool_name}' requires approval!")
-        logger.info(f"[APPROVAL GATE]   Prompt: {prompt}")
-        logger.info(f"[APPROVAL GATE]   Options: AlwaysAllow, Allow, Deny")
-        logger.info(f"[APPROVAL GATE]   Timeout: 300s")
-        logger.info(f"[APPROVAL GATE]   Default: deny")
+        if verbose:
+            logger.info(
+                f"[APPROVAL GATE] 🚦 {event}: tool '{tool_name}' requires approval - ASK_USER "
+                f"(prompt: {prompt!r}, options: AlwaysAllow/Allow/Deny, timeout: 300s, default: deny)"
+            )
         
         # Return HookResult with action="ask_user"
         # Coordinator will detect this and call approval_system.request_approval()
@@ -158,9 +172,6 @@ def _create_approval_gate_hook(coordinator: "ModuleCoordinator"):
             }
         )
         
-        logger.info(f"[APPROVAL GATE] ✅ Returning HookResult(action='ask_user')")
-        logger.info(f"[APPROVAL GATE]   HookResult dict: {result.model_dump()}")
-        
         return result
     
     return approval_gate_hook
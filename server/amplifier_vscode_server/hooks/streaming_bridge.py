@@ -12,7 +12,9 @@ Events handled:
 - tool:post → display_tool_end()
 """
 
+import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from amplifier_core import HookResult
@@ -29,115 +31,239 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Shared result for every pass-through path (treated as immutable)
+_CONTINUE = HookResult(action="continue")
 
-def register_streaming_hooks(coordinator: "ModuleCoordinator") -> list[callable]:
+# Text delta coalescing: flush after an adaptive number of buffered deltas
+# (at most MAX_BATCH) or after MAX_DELAY_S, whichever comes first
+MAX_BATCH = 64
+MAX_DELAY_S = 0.02
+
+# Weight of the newest sample in the delta rate moving average
+RATE_EWMA_ALPHA = 0.1
+
+
+class StreamingBridge:
+    """Per-session streaming state and the hook handlers that forward to it.
+    
+    Handlers are registered as bound methods, so per-event state lives in
+    slots rather than closure cells.
     """
-    Register streaming bridge hooks on the coordinator.
     
-    Args:
-        coordinator: ModuleCoordinator instance with hooks and display_system
+    __slots__ = (
+        "display_system",
+        "thinking_buffers",
+        "token_state",
+        "delta_buffer",
+        "_flush_task",
+        "_batch_target",
+        "_rate_ewma",
+        "_last_flush",
+        "_content_delta_nowait",
+        "_thinking_nowait",
+        "_tool_start_nowait",
+        "_tool_end_nowait",
+        "_has_content_delta",
+        "_has_thinking",
+        "_has_tool_start",
+        "_has_tool_end",
+    )
+    
+    def __init__(self, display_system: Any):
+        self.display_system = display_system
         
-    Returns:
-        List of unregister functions
-    """
-    display_system = coordinator.display_system
+        # Thinking deltas per open thinking block, keyed by block index
+        # (content_block:start/end pattern); joined once at block end
+        self.thinking_buffers: dict[int, list[str]] = {}
+        
+        # Track token usage across provider responses
+        self.token_state = {"input_tokens": 0, "output_tokens": 0}
+        
+        # Buffered (block_index, text) deltas awaiting a coalesced forward
+        self.delta_buffer: list[tuple[int, str]] = []
+        self._flush_task: asyncio.Task | None = None
+        
+        # Batch size follows the observed delta rate: roughly what arrives
+        # within MAX_DELAY_S, so slow streams forward each delta at once and
+        # fast streams amortize over larger batches
+        self._batch_target = 1
+        self._rate_ewma = 0.0
+        self._last_flush: float | None = None  # No rate sample before the first flush
+        
+        # Synchronous enqueue variants, when the display system offers them.
+        # amplifier-core awaits every hook handler, but forwarding through these
+        # skips a display coroutine per event.
+        self._content_delta_nowait = getattr(display_system, "display_content_delta_nowait", None)
+        self._thinking_nowait = getattr(display_system, "display_thinking_nowait", None)
+        self._tool_start_nowait = getattr(display_system, "display_tool_start_nowait", None)
+        self._tool_end_nowait = getattr(display_system, "display_tool_end_nowait", None)
+        
+        # Which display methods exist, checked once rather than per event
+        self._has_content_delta = hasattr(display_system, "display_content_delta")
+        self._has_thinking = hasattr(display_system, "display_thinking")
+        self._has_tool_start = hasattr(display_system, "display_tool_start")
+        self._has_tool_end = hasattr(display_system, "display_tool_end")
     
-    if not display_system:
-        logger.warning("No display_system available - streaming hooks will be no-ops")
+    def token_usage(self) -> dict[str, int]:
+        """Return a snapshot of accumulated token usage."""
+        return self.token_state.copy()
     
-    unregisters = []
+    async def flush_deltas(self) -> None:
+        """Forward buffered text deltas, joining runs that share a block index."""
+        task = self._flush_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._flush_task = None
+        if not self.delta_buffer:
+            return
+        
+        pending = self.delta_buffer
+        self.delta_buffer = []
+        
+        now = time.monotonic()
+        last, self._last_flush = self._last_flush, now
+        if last is not None and now > last:
+            rate = len(pending) / (now - last)
+            self._rate_ewma += RATE_EWMA_ALPHA * (rate - self._rate_ewma)
+            self._batch_target = min(max(int(self._rate_ewma * MAX_DELAY_S), 1), MAX_BATCH)
+        
+        runs = []
+        run_index, run_texts = pending[0][0], []
+        for block_index, text in pending:
+            if block_index != run_index:
+                runs.append(("".join(run_texts), run_index))
+                run_index, run_texts = block_index, []
+            run_texts.append(text)
+        runs.append(("".join(run_texts), run_index))
+        
+        if self._content_delta_nowait is not None:
+            for text, block_index in runs:
+                self._content_delta_nowait(text, block_index)
+        else:
+            for text, block_index in runs:
+                await self.display_system.display_content_delta(text, block_index)
     
-    # Track current thinking block (content_block:start/end pattern)
-    thinking_state = {"current_thinking": "", "current_block_index": None}
+    def close(self) -> None:
+        """Cancel any scheduled flush and discard buffered deltas."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self.delta_buffer = []
     
-    # Track token usage across provider responses
-    token_state = {"input_tokens": 0, "output_tokens": 0}
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(MAX_DELAY_S)
+        try:
+            await self.flush_deltas()
+        except Exception as e:
+            logger.error(f"Error flushing buffered content deltas: {e}", exc_info=True)
     
     # Content block start - track thinking blocks
-    async def on_content_block_start(event: str, data: dict[str, Any]) -> HookResult:
+    def _on_content_block_start(self, data: dict[str, Any]) -> HookResult:
         """Track start of content blocks to identify thinking blocks."""
-        logger.info(f"[THINKING] content_block:start received, data keys: {list(data.keys())}")
-        
         # Extract block type and index from data
         block_type = data.get("block_type")  # Direct key in data
         block_index = data.get("block_index", data.get("index", 0))
         
-        logger.info(f"[THINKING] Block start - type={block_type}, index={block_index}")
-        
         if block_type == "thinking":
-            thinking_state["current_thinking"] = ""
-            thinking_state["current_block_index"] = block_index
-            logger.info(f"[THINKING] ✓ Started tracking thinking block at index={block_index}")
+            self.thinking_buffers[block_index] = []
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"[THINKING] content_block:start - type={block_type}, index={block_index}, "
+                f"tracking={block_type == 'thinking'}, data keys: {list(data)}"
+            )
         
-        return HookResult(action="continue")
+        return _CONTINUE
     
-    # Content block delta - progressive content and thinking updates
-    async def on_content_block_delta(event: str, data: dict[str, Any]) -> HookResult:
-        """Forward content deltas to display system."""
-        if not display_system:
-            return HookResult(action="continue")
+    # Content block start/delta/end - one handler registered for all three
+    async def on_content_block(self, event: str, data: dict[str, Any]) -> HookResult:
+        """Dispatch content block events; deltas, the hot path, are handled inline."""
+        if event != CONTENT_BLOCK_DELTA:
+            if event == CONTENT_BLOCK_START:
+                return self._on_content_block_start(data)
+            return await self.on_content_block_end(event, data)
+        
+        # Content block delta - progressive content and thinking updates
+        if not self.display_system:
+            return _CONTINUE
         
         delta_data = data.get("delta", {})
         delta_type = delta_data.get("type")
         block_index = data.get("index", data.get("block_index", 0))
         
-        logger.info(f"[THINKING] content_block:delta - type={delta_type}, index={block_index}")
+        # Thinking deltas get a single, more detailed line below
+        verbose = logger.isEnabledFor(logging.INFO)
+        if verbose and delta_type != "thinking_delta":
+            logger.info(f"[THINKING] content_block:delta - type={delta_type}, index={block_index}")
         
         try:
             if delta_type == "text_delta":
                 # Progressive text content
                 text = delta_data.get("text", "")
-                if text and hasattr(display_system, "display_content_delta"):
-                    await display_system.display_content_delta(text, block_index)
-                    logger.debug(f"Forwarded text delta: {len(text)} chars")
+                if text and self._has_content_delta:
+                    self.delta_buffer.append((block_index, text))
+                    if len(self.delta_buffer) >= self._batch_target:
+                        await self.flush_deltas()
+                    elif self._flush_task is None:
+                        self._flush_task = asyncio.create_task(self._flush_after_delay())
             
             elif delta_type == "thinking_delta":
                 # Accumulate thinking content for end event
                 thinking_text = delta_data.get("thinking", "")
-                if thinking_text:
-                    thinking_state["current_thinking"] += thinking_text
-                    logger.info(f"[THINKING] Accumulated thinking delta: {len(thinking_text)} chars (total: {len(thinking_state['current_thinking'])})")
+                buf = self.thinking_buffers.get(block_index)
+                if thinking_text and buf is not None:
+                    buf.append(thinking_text)
+                    if verbose:
+                        logger.info(f"[THINKING] content_block:delta - type={delta_type}, index={block_index}, accumulated {len(thinking_text)} chars (total: {sum(map(len, buf))})")
         
         except Exception as e:
             logger.error(f"[THINKING] Error forwarding content delta: {e}", exc_info=True)
         
-        return HookResult(action="continue")
+        return _CONTINUE
     
     # Content block end - emit complete thinking blocks AND track token usage
-    async def on_content_block_end(event: str, data: dict[str, Any]) -> HookResult:
+    async def on_content_block_end(self, event: str, data: dict[str, Any]) -> HookResult:
         """Emit complete thinking block when content block ends."""
-        if not display_system:
-            return HookResult(action="continue")
+        if not self.display_system:
+            return _CONTINUE
+        
+        # Forward any buffered text first so deltas precede the block end
+        if self.delta_buffer:
+            await self.flush_deltas()
         
         block_index = data.get("block_index", data.get("index", 0))
         total_blocks = data.get("total_blocks")
         is_last_block = block_index == total_blocks - 1 if total_blocks else False
         
-        logger.info(f"[THINKING] content_block:end - index={block_index}, total_blocks={total_blocks}, is_last={is_last_block}")
-        logger.info(f"[THINKING] State: current_index={thinking_state['current_block_index']}, accumulated={len(thinking_state['current_thinking'])} chars")
-        logger.info(f"[THINKING] content_block:end data keys: {list(data.keys())}")
+        buf = self.thinking_buffers.pop(block_index, None)
+        
+        verbose = logger.isEnabledFor(logging.INFO)
+        if verbose:
+            logger.info(
+                f"[THINKING] content_block:end - index={block_index}, total_blocks={total_blocks}, "
+                f"is_last={is_last_block}, thinking={buf is not None}, "
+                f"accumulated={sum(map(len, buf)) if buf else 0} chars, "
+                f"open_blocks={list(self.thinking_buffers)}, data keys: {list(data)}"
+            )
         
         # Extract token usage from the last block (contains response usage)
         usage = data.get("usage")
         if usage and is_last_block:
             input_delta = usage.get("input_tokens", 0)
             output_delta = usage.get("output_tokens", 0)
-            token_state["input_tokens"] += input_delta
-            token_state["output_tokens"] += output_delta
-            logger.info(f"[TOKEN TRACKING] Updated from content_block:end: +{input_delta} input, +{output_delta} output → Total: input={token_state['input_tokens']}, output={token_state['output_tokens']}")
+            self.token_state["input_tokens"] += input_delta
+            self.token_state["output_tokens"] += output_delta
+            if verbose:
+                logger.info(f"[TOKEN TRACKING] Updated from content_block:end: +{input_delta} input, +{output_delta} output → Total: input={self.token_state['input_tokens']}, output={self.token_state['output_tokens']}")
         
         # Check if this was a thinking block - try both accumulated and direct content
-        if thinking_state["current_block_index"] == block_index:
-            logger.info(f"[THINKING] This is the tracked thinking block (index {block_index})")
-            
+        if buf is not None:
             # Get thinking content from accumulated deltas OR from block data directly
-            thinking_content = thinking_state["current_thinking"]
+            thinking_content = "".join(buf)
             
             # If no accumulated content, try extracting from block data directly
             if not thinking_content:
                 block = data.get("block", {})
-                logger.info(f"[THINKING] Block data keys: {list(block.keys())}")
-                logger.info(f"[THINKING] Block data: {block}")
                 
                 # Try different possible keys for thinking content
                 thinking_content = (
@@ -146,30 +272,32 @@ def register_streaming_hooks(coordinator: "ModuleCoordinator") -> list[callable]
                     block.get("text") or
                     ""
                 )
-                logger.info(f"[THINKING] Extracted from block data: {len(thinking_content)} chars")
+                if verbose:
+                    logger.info(f"[THINKING] Extracted {len(thinking_content)} chars from block data: {block}")
             
             if thinking_content:
                 try:
-                    logger.info(f"[THINKING] Emitting thinking block: {len(thinking_content)} chars")
-                    if hasattr(display_system, "display_thinking"):
-                        await display_system.display_thinking(thinking_content)
-                        logger.info(f"[THINKING] display_thinking() called successfully")
+                    if self._thinking_nowait is not None:
+                        self._thinking_nowait(thinking_content)
+                    elif self._has_thinking:
+                        await self.display_system.display_thinking(thinking_content)
                     else:
                         logger.warning(f"[THINKING] display_system missing display_thinking method")
+                    if verbose:
+                        logger.info(f"[THINKING] Emitted thinking block (index {block_index}): {len(thinking_content)} chars")
                 except Exception as e:
                     logger.error(f"[THINKING] Error forwarding thinking block: {e}", exc_info=True)
-                finally:
-                    # Reset thinking state
-                    thinking_state["current_thinking"] = ""
-                    thinking_state["current_block_index"] = None
         
-        return HookResult(action="continue")
+        return _CONTINUE
     
     # Tool execution start
-    async def on_tool_pre(event: str, data: dict[str, Any]) -> HookResult:
+    async def on_tool_pre(self, event: str, data: dict[str, Any]) -> HookResult:
         """Forward tool start events to display system."""
-        if not display_system:
-            return HookResult(action="continue")
+        if not self.display_system:
+            return _CONTINUE
+        
+        if self.delta_buffer:
+            await self.flush_deltas()
         
         try:
             tool_name = data.get("tool_name", "unknown")
@@ -179,8 +307,11 @@ def register_streaming_hooks(coordinator: "ModuleCoordinator") -> list[callable]
             tool_use = data.get("tool_use", {})
             operation = tool_use.get("name", tool_name)
             
-            if hasattr(display_system, "display_tool_start"):
-                await display_system.display_tool_start(
+            if self._tool_start_nowait is not None:
+                self._tool_start_nowait(tool_name, operation, tool_input)
+                logger.debug(f"Forwarded tool start: {tool_name}")
+            elif self._has_tool_start:
+                await self.display_system.display_tool_start(
                     tool_name=tool_name,
                     operation=operation,
                     input_data=tool_input
@@ -190,15 +321,13 @@ def register_streaming_hooks(coordinator: "ModuleCoordinator") -> list[callable]
         except Exception as e:
             logger.error(f"Error forwarding tool start: {e}")
         
-        return HookResult(action="continue")
-    
-
+        return _CONTINUE
     
     # Tool execution complete
-    async def on_tool_post(event: str, data: dict[str, Any]) -> HookResult:
+    async def on_tool_post(self, event: str, data: dict[str, Any]) -> HookResult:
         """Forward tool completion events to display system."""
-        if not display_system:
-            return HookResult(action="continue")
+        if not self.display_system:
+            return _CONTINUE
         
         try:
             tool_name = data.get("tool_name", "unknown")
@@ -208,8 +337,11 @@ def register_streaming_hooks(coordinator: "ModuleCoordinator") -> list[callable]
             # Extract operation from result if available
             operation = data.get("tool_use", {}).get("name", tool_name)
             
-            if hasattr(display_system, "display_tool_end"):
-                await display_system.display_tool_end(
+            if self._tool_end_nowait is not None:
+                self._tool_end_nowait(tool_name, operation, result, duration_ms)
+                logger.debug(f"Forwarded tool end: {tool_name}")
+            elif self._has_tool_end:
+                await self.display_system.display_tool_end(
                     tool_name=tool_name,
                     operation=operation,
                     result=result,
@@ -220,45 +352,53 @@ def register_streaming_hooks(coordinator: "ModuleCoordinator") -> list[callable]
         except Exception as e:
             logger.error(f"Error forwarding tool end: {e}")
         
-        return HookResult(action="continue")
+        return _CONTINUE
+
+
+def register_streaming_hooks(coordinator: "ModuleCoordinator") -> list[callable]:
+    """
+    Register streaming bridge hooks on the coordinator.
+    
+    Args:
+        coordinator: ModuleCoordinator instance with hooks and display_system
+        
+    Returns:
+        List of unregister functions
+    """
+    display_system = coordinator.display_system
+    
+    if not display_system:
+        logger.warning("No display_system available - streaming hooks will be no-ops")
+    
+    bridge = StreamingBridge(display_system)
+    unregisters = []
     
     # Register all hooks with priority 1000 (high priority, but after core hooks)
     hooks = coordinator.hooks
     
     # Make token_state accessible for retrieval
-    coordinator.register_capability("vscode.token_usage", lambda: token_state.copy())
-    
-    unregisters.append(
-        hooks.register(
-            CONTENT_BLOCK_START,
-            on_content_block_start,
-            priority=1000,
-            name="vscode-streaming-start"
-        )
-    )
-    
-    unregisters.append(
-        hooks.register(
-            CONTENT_BLOCK_DELTA,
-            on_content_block_delta,
-            priority=1000,
-            name="vscode-streaming-delta"
-        )
-    )
+    coordinator.register_capability("vscode.token_usage", bridge.token_usage)
     
-    unregisters.append(
-        hooks.register(
-            CONTENT_BLOCK_END,
-            on_content_block_end,
-            priority=1000,
-            name="vscode-streaming-end"
+    # One shared handler for the content block events
+    on_content_block = bridge.on_content_block
+    for event, name in (
+        (CONTENT_BLOCK_START, "vscode-streaming-start"),
+        (CONTENT_BLOCK_DELTA, "vscode-streaming-delta"),
+        (CONTENT_BLOCK_END, "vscode-streaming-end"),
+    ):
+        unregisters.append(
+            hooks.register(
+                event,
+                on_content_block,
+                priority=1000,
+                name=name
+            )
         )
-    )
     
     unregisters.append(
         hooks.register(
             TOOL_PRE,
-            on_tool_pre,
+            bridge.on_tool_pre,
             priority=1000,
             name="vscode-tool-pre"
         )
@@ -267,12 +407,15 @@ def register_streaming_hooks(coordinator: "ModuleCoordinator") -> list[callable]
     unregisters.append(
         hooks.register(
             TOOL_POST,
-            on_tool_post,
+            bridge.on_tool_post,
             priority=1000,
             name="vscode-tool-post"
         )
     )
     
+    # Unregistering also stops the bridge's delayed flush
+    unregisters.append(bridge.close)
+    
     logger.info("Registered streaming bridge hooks for VSCode display (token tracking via content_block:end)")
     
     return unregisters
@@ -0,0 +1,79 @@
+"""Pure-ASGI middleware for Amplifier VS Code Server."""
+
+import itertools
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Methods advertised on preflight responses (mirrors allow_methods=["*"])
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class InfraMiddleware:
+    """Single middleware layer for cross-cutting HTTP concerns.
+
+    Infra concerns are folded into this one pass instead of being stacked
+    as separate ``add_middleware`` layers, each of which would cost an extra
+    await hop per request. Works directly on raw ASGI messages:
+
+    - Request IDs: honours an incoming ``x-request-id`` or assigns one,
+      exposes it as ``request.state.request_id`` and echoes it on the response.
+    - CORS for VS Code webview origins: origins are compared as bytes,
+      preflights are answered without reaching the router, and headers are
+      appended to ``http.response.start`` without buffering the body.
+
+    Access logging is left to uvicorn's access logger.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origin_prefix: bytes = b"vscode-webview://"):
+        self.app = app
+        self.allow_origin_prefix = allow_origin_prefix
+        self._request_ids = itertools.count(1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value
+            elif name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if request_id is None:
+            request_id = b"%x" % next(self._request_ids)
+        scope.setdefault("state", {})["request_id"] = request_id.decode("latin-1")
+
+        extra_headers = [(b"x-request-id", request_id)]
+
+        if origin is not None and origin.startswith(self.allow_origin_prefix):
+            extra_headers.append((b"access-control-allow-origin", origin))
+            extra_headers.append((b"access-control-allow-credentials", b"true"))
+            extra_headers.append((b"vary", b"Origin"))
+
+            # Preflight: answer directly
+            if scope["method"] == "OPTIONS" and request_method is not None:
+                extra_headers.append((b"access-control-allow-methods", _ALLOW_METHODS))
+                extra_headers.append((b"access-control-max-age", b"600"))
+                if request_headers:
+                    extra_headers.append((b"access-control-allow-headers", request_headers))
+                extra_headers.append((b"content-length", b"2"))
+                extra_headers.append((b"content-type", b"text/plain; charset=utf-8"))
+                await send({"type": "http.response.start", "status": 200, "headers": extra_headers})
+                await send({"type": "http.response.body", "body": b"OK"})
+                return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
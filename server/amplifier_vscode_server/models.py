@@ -1,7 +1,7 @@
 """Pydantic models for Amplifier VS Code Server API."""
 
 from typing import Any, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
@@ -84,7 +84,12 @@ class ApprovalRequest(BaseModel):
 
 
 # Response models
-class CreateSessionResponse(BaseModel):
+class ResponseModel(BaseModel):
+    """Base for response models: immutable once built, no extra fields."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class CreateSessionResponse(ResponseModel):
     """Response from session creation."""
     session_id: str
     status: str
@@ -92,20 +97,20 @@ class CreateSessionResponse(BaseModel):
     created_at: datetime
 
 
-class PromptResponse(BaseModel):
+class PromptResponse(ResponseModel):
     """Response from prompt submission."""
     request_id: str
     status: str = "processing"
     message: str = "Prompt submitted, subscribe to events for response"
 
 
-class TokenUsage(BaseModel):
+class TokenUsage(ResponseModel):
     """Token usage statistics."""
     input_tokens: int
     output_tokens: int
 
 
-class SessionStatus(BaseModel):
+class SessionStatus(ResponseModel):
     """Session status information."""
     session_id: str
     status: Literal["idle", "processing", "awaiting_approval", "error", "stopped"]
@@ -117,7 +122,7 @@ class SessionStatus(BaseModel):
     pending_approval: dict[str, Any] | None = None
 
 
-class SessionListItem(BaseModel):
+class SessionListItem(ResponseModel):
     """Session summary for list endpoint."""
     session_id: str
     status: str
@@ -125,19 +130,19 @@ class SessionListItem(BaseModel):
     created_at: datetime
 
 
-class SessionListResponse(BaseModel):
+class SessionListResponse(ResponseModel):
     """Response from list sessions."""
     sessions: list[SessionListItem]
     total: int
 
 
-class DeleteSessionResponse(BaseModel):
+class DeleteSessionResponse(ResponseModel):
     """Response from session deletion."""
     status: str = "stopped"
     message: str = "Session stopped and cleaned up"
 
 
-class ApprovalResponse(BaseModel):
+class ApprovalResponse(ResponseModel):
     """Response from approval submission."""
     status: str = "approved"
     message: str = "Approval decision recorded"
@@ -151,7 +156,7 @@ class ModuleConfig(BaseModel):
     config: dict[str, Any] = Field(default_factory=dict)
 
 
-class ProfileSummary(BaseModel):
+class ProfileSummary(ResponseModel):
     """Profile summary for list endpoint."""
     name: str
     collection: str | None = None
@@ -159,7 +164,7 @@ class ProfileSummary(BaseModel):
     extends: str | None = None
 
 
-class ProfileDetail(BaseModel):
+class ProfileDetail(ResponseModel):
     """Detailed profile information."""
     name: str
     collection: str | None = None
@@ -171,13 +176,13 @@ class ProfileDetail(BaseModel):
     agents: list[str] = Field(default_factory=list)
 
 
-class ProfileListResponse(BaseModel):
+class ProfileListResponse(ResponseModel):
     """Response from list profiles."""
     profiles: list[ProfileSummary]
 
 
 # Server info models
-class HealthResponse(BaseModel):
+class HealthResponse(ResponseModel):
     """Health check response."""
     status: str = "healthy"
     version: str = "0.1.0"
@@ -185,14 +190,14 @@ class HealthResponse(BaseModel):
     active_sessions: int = 0
 
 
-class ServerCapabilities(BaseModel):
+class ServerCapabilities(ResponseModel):
     """Server capabilities."""
     streaming: bool = True
     extended_thinking: bool = True
     tool_use: bool = True
 
 
-class ServerConfig(BaseModel):
+class ServerConfig(ResponseModel):
     """Server configuration."""
     host: str = "127.0.0.1"
     port: int = 8765
@@ -200,7 +205,7 @@ class ServerConfig(BaseModel):
     collections_path: str
 
 
-class InfoResponse(BaseModel):
+class InfoResponse(ResponseModel):
     """Server info response."""
     version: str = "0.1.0"
     amplifier_core_version: str
@@ -209,13 +214,13 @@ class InfoResponse(BaseModel):
 
 
 # Error models
-class ErrorDetail(BaseModel):
+class ErrorDetail(ResponseModel):
     """Error detail information."""
     code: str
     message: str
     details: dict[str, Any] = Field(default_factory=dict)
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseModel):
     """Standard error response."""
     error: ErrorDetail
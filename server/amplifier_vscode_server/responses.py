@@ -0,0 +1,32 @@
+"""Response classes for Amplifier VS Code Server."""
+
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Defined locally rather than imported from ``fastapi.responses``, whose
+    ``ORJSONResponse`` is deprecated in newer FastAPI releases.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Serialize an already-validated model straight to a response.
+
+    FastAPI passes returned ``Response`` objects through untouched, so the
+    route's ``response_model`` stays for the OpenAPI schema without being
+    validated and dumped a second time.
+    """
+    return Response(
+        model.model_dump_json().encode(),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -1,32 +1,75 @@
 """Profile management routes."""
 
+import functools
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 
 from ..models import ProfileListResponse, ProfileSummary, ProfileDetail
-from amplifier_profiles import ProfileLoader
+from ..responses import model_response
+
+if TYPE_CHECKING:
+    from amplifier_profiles import ProfileLoader
 
 router = APIRouter()
 
-# Initialize profile loader with default search paths
-_profile_loader: ProfileLoader | None = None
 
+@functools.cache
+def _get_profile_loader() -> "ProfileLoader":
+    """Get the profile loader, created with default search paths on first use."""
+    # Imported on first use to keep it off the server's startup path
+    from amplifier_profiles import ProfileLoader
+    
+    search_paths = [
+        Path.home() / ".amplifier" / "profiles",
+        Path(".amplifier") / "profiles",
+    ]
+    return ProfileLoader(search_paths=search_paths)
+
+
+# Profiles are files that rarely change while the extension polls them, so
+# serialized responses are reused for PROFILE_CACHE_TTL seconds
+PROFILE_CACHE_TTL = 5.0
+_PROFILE_CACHE_MAX = 128
+
+# (route, argument) -> (expiry on the monotonic clock, JSON body)
+_response_cache: dict[tuple[str, str | None], tuple[float, bytes]] = {}
 
-def _get_profile_loader() -> ProfileLoader:
-    """Get or create profile loader."""
-    global _profile_loader
-    if _profile_loader is None:
-        search_paths = [
-            Path.home() / ".amplifier" / "profiles",
-            Path(".amplifier") / "profiles",
-        ]
-        _profile_loader = ProfileLoader(search_paths=search_paths)
-    return _profile_loader
+
+def _cached_response(key: tuple[str, str | None]) -> Response | None:
+    """Return a fresh cached response for key, if there is one."""
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return Response(entry[1], media_type="application/json")
+
+
+def _cache_response(key: tuple[str, str | None], response: Response) -> Response:
+    """Remember a successful response's body for PROFILE_CACHE_TTL seconds."""
+    now = time.monotonic()
+    if len(_response_cache) >= _PROFILE_CACHE_MAX:
+        # Keys include caller-supplied names; shed the stale ones, or the
+        # oldest (dicts keep insertion order) when none are stale yet
+        stale = [k for k, (expiry, _) in _response_cache.items() if expiry <= now]
+        for k in stale:
+            del _response_cache[k]
+        if not stale:
+            del _response_cache[next(iter(_response_cache))]
+    _response_cache[key] = (now + PROFILE_CACHE_TTL, response.body)
+    return response
 
 
 @router.get("/profiles", response_model=ProfileListResponse)
-async def list_profiles(collection: str | None = None) -> ProfileListResponse:
+async def list_profiles(collection: str | None = None) -> Response:
     """List all available profiles."""
+    cache_key = ("list", collection)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
     loader = _get_profile_loader()
     
     try:
@@ -37,7 +80,8 @@ async def list_profiles(collection: str | None = None) -> ProfileListResponse:
         if collection:
             all_profiles = [p for p in all_profiles if p.get("collection") == collection]
         
-        # Convert to response models
+        # Convert to response models (validated: loader values come from
+        # user-edited profile files)
         profiles = [
             ProfileSummary(
                 name=p.get("name", "unknown"),
@@ -48,7 +92,7 @@ async def list_profiles(collection: str | None = None) -> ProfileListResponse:
             for p in all_profiles
         ]
         
-        return ProfileListResponse(profiles=profiles)
+        return _cache_response(cache_key, model_response(ProfileListResponse(profiles=profiles)))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -63,8 +107,13 @@ async def list_profiles(collection: str | None = None) -> ProfileListResponse:
 
 
 @router.get("/profiles/{profile_name}", response_model=ProfileDetail)
-async def get_profile(profile_name: str) -> ProfileDetail:
+async def get_profile(profile_name: str) -> Response:
     """Get detailed information about a profile."""
+    cache_key = ("detail", profile_name)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
     loader = _get_profile_loader()
     
     try:
@@ -72,7 +121,7 @@ async def get_profile(profile_name: str) -> ProfileDetail:
         profile = loader.load_profile(profile_name)
         
         # Convert to response model
-        return ProfileDetail(
+        return _cache_response(cache_key, model_response(ProfileDetail(
             name=profile.get("name", profile_name),
             collection=profile.get("collection"),
             description=profile.get("description", ""),
@@ -81,7 +130,7 @@ async def get_profile(profile_name: str) -> ProfileDetail:
             tools=profile.get("tools", []),
             hooks=profile.get("hooks", []),
             agents=profile.get("agents", []),
-        )
+        )))
     except FileNotFoundError:
         raise HTTPException(
             status_code=404,
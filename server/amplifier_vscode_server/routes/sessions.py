@@ -1,16 +1,21 @@
 """Session management routes."""
 
 import asyncio
-import json
+import heapq
 import logging
+import time
 import traceback
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache
+from itertools import count, islice
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Dict
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
-from sse_starlette.sse import EventSourceResponse
+import orjson
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 
 logger = logging.getLogger(__name__)
 
@@ -23,89 +28,205 @@ from ..models import (
     ApprovalResponse,
     SessionStatus,
     SessionListResponse,
-    SessionListItem,
     DeleteSessionResponse,
     TokenUsage,
 )
-from ..core.session_runner import SessionRunner
+from ..responses import model_response
+from ..core.events import SessionEvent, sse_message
+from ..core.session_state import SessionState
+
+# SessionRunner pulls in amplifier-core; defer it to the first session
+if TYPE_CHECKING:
+    from ..core.session_runner import SessionRunner
 
 router = APIRouter()
 
-# In-memory session storage
-_sessions: Dict[str, SessionRunner] = {}
+# Keepalive frame sent on idle SSE streams, framed once as wire bytes
+_PING = b"event: ping\r\ndata: keepalive\r\n\r\n"
+
+_now = datetime.now
+
+# Prompt request IDs only need to be unique within this process
+_next_request_number = count().__next__
+
+
+@lru_cache(maxsize=4)
+def _iso_for(sec: int) -> str:
+    """ISO timestamp for a whole second, shared by every stream opened in it."""
+    return datetime.fromtimestamp(sec).isoformat()
+
+
+def _event_frame(event: SessionEvent) -> bytes:
+    """Frame one queued event; one that cannot be encoded becomes an error frame."""
+    try:
+        return sse_message(event.encode())
+    except Exception as e:
+        logger.warning(
+            "Could not encode %s event for session %s: %s", event.event, event.session_id, e
+        )
+        return sse_message(SessionEvent("error", event.session_id, {
+            "error": f"Could not encode {event.event} event: {e}"
+        }).encode())
+
+
+class SessionRegistry:
+    """In-memory session storage with a status index.
+    
+    Each session keeps a prebuilt list entry (in creation order), a plain
+    dict in SessionListItem's shape ready for orjson, rebuilt only when its
+    status changes. Sessions are also bucketed by status, with their
+    creation sequence number, so filtered listings never scan every
+    session yet still come out in creation order.
+    """
+    
+    __slots__ = ("_by_id", "_items", "_by_status", "_next_seq")
+    
+    def __init__(self) -> None:
+        self._by_id: Dict[str, "SessionRunner"] = {}
+        self._items: Dict[str, dict[str, Any]] = {}
+        # status -> {session_id: creation sequence number}
+        self._by_status: defaultdict[str, Dict[str, int]] = defaultdict(dict)
+        self._next_seq = count().__next__
+    
+    def __len__(self) -> int:
+        return len(self._by_id)
+    
+    def get(self, session_id: str) -> "SessionRunner | None":
+        """Look up a session by ID."""
+        return self._by_id.get(session_id)
+    
+    def add(self, runner: "SessionRunner") -> None:
+        """Register a started session and start tracking its status."""
+        session_id = runner.session_id
+        item = {
+            "session_id": session_id,
+            "status": runner.status,
+            "profile": runner.profile_name,
+            "created_at": runner.created_at,
+        }
+        self._by_id[session_id] = runner
+        self._items[session_id] = item
+        self._by_status[runner.status][session_id] = self._next_seq()
+        runner.status_listener = self.set_status
+    
+    def remove(self, session_id: str) -> "SessionRunner | None":
+        """Unregister a session, returning it if it was present."""
+        runner = self._by_id.pop(session_id, None)
+        if runner is not None:
+            runner.status_listener = None
+            self._items.pop(session_id, None)
+            bucket = self._by_status.get(runner.status)
+            if bucket is not None:
+                bucket.pop(session_id, None)
+        return runner
+    
+    def set_status(self, runner: "SessionRunner", old_status: str) -> None:
+        """Refresh a session's list entry and move it to its new status bucket."""
+        session_id = runner.session_id
+        seq = self._by_status[old_status].pop(session_id)
+        self._items[session_id] = {**self._items[session_id], "status": runner.status}
+        self._by_status[runner.status][session_id] = seq
+    
+    def iter_status(self, status: str | None, limit: int) -> list[dict[str, Any]]:
+        """Snapshot up to ``limit`` list entries, optionally for one status.
+        
+        Entries come out in creation order. Only the returned entries are
+        copied, so the result stays stable while sessions come and go
+        without costing a full scan.
+        """
+        limit = max(limit, 0)
+        if not status:
+            return list(islice(self._items.values(), limit))
+        
+        # Buckets are ordered by last status change; pick the oldest
+        # sessions by creation sequence instead
+        bucket = self._by_status.get(status)
+        if not bucket:
+            return []
+        items = self._items
+        return [items[session_id] for session_id, _ in heapq.nsmallest(limit, bucket.items(), key=itemgetter(1))]
+
+
+_registry = SessionRegistry()
+
+
+def _api_error(status_code: int, code: str, message: str, details: dict[str, Any]) -> HTTPException:
+    """Build an HTTPException carrying the API's error envelope."""
+    return HTTPException(
+        status_code=status_code,
+        detail={"error": {"code": code, "message": message, "details": details}},
+    )
+
+
+def _session_not_found(session_id: str) -> HTTPException:
+    """Build the 404 raised for an unknown session ID."""
+    return _api_error(
+        404,
+        "SESSION_NOT_FOUND",
+        f"Session with ID '{session_id}' not found",
+        {"session_id": session_id},
+    )
 
 
 @router.post("/sessions", response_model=CreateSessionResponse, status_code=201)
-async def create_session(request: CreateSessionRequest) -> CreateSessionResponse:
+async def create_session(request: CreateSessionRequest) -> Response:
     """Create a new Amplifier session."""
+    from ..core.session_runner import SessionRunner
+    
     session_id = str(uuid4())
     
     try:
-        logger.info(f"Creating session {session_id} with profile '{request.profile}'")
-        logger.debug(f"Credentials provided: {bool(request.credentials)}")
-        logger.debug(f"Context provided: {bool(request.context)}")
+        logger.info("Creating session %s with profile %r", session_id, request.profile)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Credentials provided: %s", bool(request.credentials))
+            logger.debug("Context provided: %s", bool(request.context))
         
         # Create session runner
         runner = SessionRunner(
             session_id=session_id,
             profile_name=request.profile,
-            credentials=request.credentials.model_dump() if request.credentials else {},
-            workspace_context=request.context.model_dump() if request.context else {},
+            credentials=request.credentials,
+            workspace_context=request.context,
         )
         
         # Start the session (initialize amplifier-core)
-        logger.info(f"Starting session {session_id}...")
+        logger.info("Starting session %s...", session_id)
         await runner.start()
         
         # Store session
-        _sessions[session_id] = runner
+        _registry.add(runner)
         
-        logger.info(f"Session {session_id} created successfully")
-        return CreateSessionResponse(
+        logger.info("Session %s created successfully", session_id)
+        return model_response(CreateSessionResponse(
             session_id=session_id,
             status="created",
             profile=request.profile,
-            created_at=datetime.now(),
-        )
+            created_at=_now(),
+        ), status_code=201)
     except Exception as e:
-        # Log full traceback for debugging
-        logger.error(f"Failed to create session {session_id}:")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Error message: {str(e)}")
-        logger.error(f"Full traceback:\n{traceback.format_exc()}")
+        # Log full traceback for debugging (only formatted if ERROR is enabled)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Failed to create session %s:\nError type: %s\nError message: %s\nFull traceback:\n%s",
+                session_id, type(e).__name__, e, traceback.format_exc(),
+            )
         
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": {
-                    "code": "SESSION_CREATE_FAILED",
-                    "message": f"Failed to create session: {str(e)}",
-                    "details": {
-                        "profile": request.profile,
-                        "error_type": type(e).__name__
-                    }
-                }
-            }
+        raise _api_error(
+            500,
+            "SESSION_CREATE_FAILED",
+            f"Failed to create session: {str(e)}",
+            {"profile": request.profile, "error_type": type(e).__name__},
         )
 
 
 @router.get("/sessions/{session_id}", response_model=SessionStatus)
-async def get_session_status(session_id: str) -> SessionStatus:
+async def get_session_status(session_id: str) -> Response:
     """Get session status."""
-    runner = _sessions.get(session_id)
+    runner = _registry.get(session_id)
     if not runner:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "SESSION_NOT_FOUND",
-                    "message": f"Session with ID '{session_id}' not found",
-                    "details": {"session_id": session_id}
-                }
-            }
-        )
+        raise _session_not_found(session_id)
     
-    return SessionStatus(
+    return model_response(SessionStatus(
         session_id=session_id,
         status=runner.status,
         profile=runner.profile_name,
@@ -117,182 +238,138 @@ async def get_session_status(session_id: str) -> SessionStatus:
             output_tokens=runner.output_tokens
         ) if runner.input_tokens > 0 else None,
         pending_approval=runner.pending_approval,
-    )
+    ))
 
 
 @router.get("/sessions/{session_id}/events")
-async def session_events(session_id: str, request: Request):
+async def session_events(session_id: str):
     """Stream session events via Server-Sent Events."""
-    runner = _sessions.get(session_id)
+    runner = _registry.get(session_id)
     if not runner:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "SESSION_NOT_FOUND",
-                    "message": f"Session with ID '{session_id}' not found",
-                    "details": {"session_id": session_id}
-                }
-            }
-        )
+        raise _session_not_found(session_id)
+    
+    from sse_starlette.sse import EventSourceResponse
     
     async def event_generator():
         """Generate SSE events from session queue."""
+        event_queue = runner.event_queue
+        runner.event_consumers += 1
         try:
-            # Send initial session:start event
-            # Note: SSE 'data' field must be a JSON string, not a dict
-            yield {
-                "event": "message",
-                "data": json.dumps({
-                    "event": "session:start",
-                    "data": {
-                        "session_id": session_id,
-                        "profile": runner.profile_name,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                })
-            }
+            # Send initial session:start event, framed like queued events
+            yield _event_frame(SessionEvent("session:start", session_id, {
+                "profile": runner.profile_name,
+                "timestamp": _iso_for(int(time.time()))
+            }))
             
-            # Stream events from queue
+            # Stream events from queue. EventSourceResponse already watches
+            # for the client disconnecting and cancels this generator when it
+            # does, so the loop does not poll for it
             while True:
-                # Check if client disconnected
-                if await request.is_disconnected():
-                    break
-                
                 try:
                     # Wait for next event with timeout for keepalive
-                    event = await asyncio.wait_for(runner.event_queue.get(), timeout=5.0)
-                    # Stringify the event data for SSE
-                    yield {"event": "message", "data": json.dumps(event)}
+                    batch = await asyncio.wait_for(event_queue.get(), timeout=5.0)
+                    # Encoded straight to wire frames (bytes bypass SSE
+                    # re-encoding), each on its own so one bad event cannot
+                    # take its batch with it; whatever else is already
+                    # queued goes out in the same write
+                    frames = [_event_frame(event) for event in batch]
+                    while True:
+                        try:
+                            batch = event_queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            break
+                        frames.extend([_event_frame(event) for event in batch])
+                    yield b"".join(frames)
                 except asyncio.TimeoutError:
-                    # Send keepalive comment
-                    yield {"event": "ping", "data": "keepalive"}
+                    # Send keepalive
+                    yield _PING
                     
         except Exception as e:
-            # Send error event
-            yield {
-                "event": "message",
-                "data": json.dumps({
-                    "event": "error",
-                    "data": {
-                        "session_id": session_id,
-                        "error": str(e)
-                    }
-                })
-            }
+            # Encoding failures are framed per event above; this only
+            # reports a stream that cannot continue
+            logger.warning("Event stream for session %s failed: %s", session_id, e)
+            yield _event_frame(SessionEvent("error", session_id, {"error": str(e)}))
+        finally:
+            runner.event_consumers -= 1
     
     return EventSourceResponse(event_generator())
 
 
 @router.post("/sessions/{session_id}/prompt", response_model=PromptResponse)
-async def submit_prompt(session_id: str, request: PromptRequest) -> PromptResponse:
+async def submit_prompt(session_id: str, request: PromptRequest) -> Response:
     """Submit a prompt to a session."""
-    runner = _sessions.get(session_id)
+    runner = _registry.get(session_id)
     if not runner:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "SESSION_NOT_FOUND",
-                    "message": f"Session with ID '{session_id}' not found",
-                    "details": {"session_id": session_id}
-                }
-            }
-        )
+        raise _session_not_found(session_id)
     
-    if runner.status == "processing":
-        raise HTTPException(
-            status_code=409,
-            detail={
-                "error": {
-                    "code": "SESSION_BUSY",
-                    "message": "Session is already processing another prompt",
-                    "details": {"session_id": session_id}
-                }
-            }
+    if runner.status is SessionState.PROCESSING:
+        raise _api_error(
+            409,
+            "SESSION_BUSY",
+            "Session is already processing another prompt",
+            {"session_id": session_id},
         )
     
     try:
         # Submit prompt asynchronously
-        request_id = f"req-{uuid4().hex[:8]}"
-        asyncio.create_task(runner.prompt(request.prompt, request.context_update))
+        request_id = f"req-{_next_request_number():08x}"
+        runner.loop.create_task(runner.prompt(request.prompt, request.context_update))
         
-        return PromptResponse(
+        return model_response(PromptResponse(
             request_id=request_id,
             status="processing",
             message="Prompt submitted, subscribe to events for response"
-        )
+        ))
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": {
-                    "code": "PROMPT_SUBMIT_FAILED",
-                    "message": f"Failed to submit prompt: {str(e)}",
-                    "details": {"session_id": session_id}
-                }
-            }
+        raise _api_error(
+            500,
+            "PROMPT_SUBMIT_FAILED",
+            f"Failed to submit prompt: {str(e)}",
+            {"session_id": session_id},
         )
 
 
 @router.post("/sessions/{session_id}/approval", response_model=ApprovalResponse)
-async def submit_approval(session_id: str, request: ApprovalRequest) -> ApprovalResponse:
+async def submit_approval(session_id: str, request: ApprovalRequest) -> Response:
     """Submit approval decision for a session."""
-    runner = _sessions.get(session_id)
+    runner = _registry.get(session_id)
     if not runner:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "SESSION_NOT_FOUND",
-                    "message": f"Session with ID '{session_id}' not found",
-                    "details": {"session_id": session_id}
-                }
-            }
-        )
+        raise _session_not_found(session_id)
     
     if not runner.pending_approval:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": {
-                    "code": "NO_PENDING_APPROVAL",
-                    "message": "No pending approval for this session",
-                    "details": {"session_id": session_id}
-                }
-            }
+        raise _api_error(
+            400,
+            "NO_PENDING_APPROVAL",
+            "No pending approval for this session",
+            {"session_id": session_id},
         )
     
     try:
         # Resolve the approval
         await runner.resolve_approval(request.decision)
         
-        return ApprovalResponse(
+        return model_response(ApprovalResponse(
             status="approved",
             message="Approval decision recorded"
-        )
+        ))
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": {
-                    "code": "APPROVAL_FAILED",
-                    "message": f"Failed to submit approval: {str(e)}",
-                    "details": {"session_id": session_id}
-                }
-            }
+        raise _api_error(
+            500,
+            "APPROVAL_FAILED",
+            f"Failed to submit approval: {str(e)}",
+            {"session_id": session_id},
         )
 
 
 @router.post("/sessions/{session_id}/test-approval")
 async def test_approval_flow(session_id: str):
     """Test endpoint to trigger approval flow manually."""
-    runner = _sessions.get(session_id)
+    runner = _registry.get(session_id)
     if not runner:
         raise HTTPException(404, "Session not found")
     
     # Manually trigger approval request for testing
-    asyncio.create_task(runner.approval_system.request_approval(
+    runner.loop.create_task(runner.approval_system.request_approval(
         prompt="Test approval: Allow this test operation?",
         options=["Allow", "Deny", "Skip"],
         timeout=30.0,
@@ -304,69 +381,41 @@ async def test_approval_flow(session_id: str):
 
 
 @router.delete("/sessions/{session_id}", response_model=DeleteSessionResponse)
-async def delete_session(session_id: str) -> DeleteSessionResponse:
+async def delete_session(session_id: str) -> Response:
     """Stop and delete a session."""
-    runner = _sessions.get(session_id)
-    if not runner:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "SESSION_NOT_FOUND",
-                    "message": f"Session with ID '{session_id}' not found",
-                    "details": {"session_id": session_id}
-                }
-            }
-        )
+    # Unregister up front (removed even if stop fails), so a concurrent
+    # delete of the same session gets a 404 rather than a second stop
+    runner = _registry.remove(session_id)
+    if runner is None:
+        raise _session_not_found(session_id)
     
     try:
         # Stop the session
         await runner.stop()
         
-        # Remove from storage
-        del _sessions[session_id]
-        
-        return DeleteSessionResponse(
+        return model_response(DeleteSessionResponse(
             status="stopped",
             message="Session stopped and cleaned up"
-        )
+        ))
     except Exception as e:
-        # Remove even if stop fails
-        _sessions.pop(session_id, None)
-        
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": {
-                    "code": "SESSION_DELETE_FAILED",
-                    "message": f"Failed to delete session: {str(e)}",
-                    "details": {"session_id": session_id}
-                }
-            }
+        raise _api_error(
+            500,
+            "SESSION_DELETE_FAILED",
+            f"Failed to delete session: {str(e)}",
+            {"session_id": session_id},
         )
 
 
 @router.get("/sessions", response_model=SessionListResponse)
-async def list_sessions(status: str | None = None, limit: int = 50) -> SessionListResponse:
+async def list_sessions(status: str | None = None, limit: int = 50) -> Response:
     """List all active sessions."""
-    sessions = []
-    
-    for session_id, runner in _sessions.items():
-        # Filter by status if provided
-        if status and runner.status != status:
-            continue
-        
-        sessions.append(SessionListItem(
-            session_id=session_id,
-            status=runner.status,
-            profile=runner.profile_name,
-            created_at=runner.created_at
-        ))
-    
-    # Apply limit
-    sessions = sessions[:limit]
+    # Filter by status if provided, straight from its bucket; entries are
+    # prebuilt, so the limit is applied while collecting
+    sessions = _registry.iter_status(status, limit)
     
-    return SessionListResponse(
-        sessions=sessions,
-        total=len(_sessions)
+    # Entries are already in SessionListItem's shape; encode them directly
+    # rather than through the response model
+    return Response(
+        orjson.dumps({"sessions": sessions, "total": len(_registry)}),
+        media_type="application/json",
     )